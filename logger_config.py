@@ -1,68 +1,313 @@
 import logging
 import os
-import glob
+import io
+import atexit
+import copy
+import queue
+import threading
+import functools
 import platform
 import sys
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 import json
-import psutil
 try:
-    import GPUtil
+    import orjson
 except ImportError:
-    GPUtil = None
+    orjson = None
 
 # Import colorama for cross-platform color support
 import colorama
-colorama.init()
+
+# colorama.init() se difiere hasta crear el primer formateador de consola
+_COLOR_INITED = False
+
+def _init_color():
+    """Instala los hooks de consola de colorama una sola vez"""
+    global _COLOR_INITED
+    if _COLOR_INITED:
+        return
+    _COLOR_INITED = True
+    # Solo instalar los hooks de consola cuando la salida es una terminal
+    if sys.stdout.isatty():
+        colorama.init()
+
+# Sistemas de archivos virtuales que no aportan información de disco
+PSEUDO_FILESYSTEMS = frozenset({'squashfs', 'overlay', 'tmpfs', 'devtmpfs'})
+
+def _dumps(obj, pretty=True):
+    """Serializa a JSON (indentado o compacto) usando orjson si está disponible"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+# Opciones para escribir JSON directamente al archivo binario
+_ORJSON_BYTES_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if orjson else 0
+)
+_ORJSON_PRETTY_BYTES_OPTIONS = _ORJSON_BYTES_OPTIONS | (orjson.OPT_INDENT_2 if orjson else 0)
+
+def _level_from_env(default=logging.DEBUG):
+    """Nivel del logger desde MONITOR_LOG_LEVEL (p. ej. INFO), o el nivel por defecto"""
+    level = logging.getLevelName(os.getenv('MONITOR_LOG_LEVEL', '').upper())
+    return level if isinstance(level, int) else default
+
+# Último segundo formateado y su prefijo 'YYYY-mm-dd HH:MM:SS'
+_timestamp_cache = [None, '']
+
+def _format_timestamp(created):
+    """Formatea un timestamp con milisegundos reutilizando el prefijo por segundo"""
+    sec = int(created)
+    if sec != _timestamp_cache[0]:
+        _timestamp_cache[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        _timestamp_cache[0] = sec
+    return f"{_timestamp_cache[1]}.{int((created - sec) * 1000):03d}"
 
 class CustomFormatter(logging.Formatter):
     """Formateador personalizado que incluye colores en la consola"""
+    # Secuencias de escape materializadas como str al cargar la clase
     COLORS = {
-        'DEBUG': colorama.Fore.CYAN,
-        'INFO': colorama.Fore.GREEN,
-        'WARNING': colorama.Fore.YELLOW,
-        'ERROR': colorama.Fore.RED,
-        'CRITICAL': colorama.Fore.MAGENTA
+        level: str(color) for level, color in {
+            'DEBUG': colorama.Fore.CYAN,
+            'INFO': colorama.Fore.GREEN,
+            'WARNING': colorama.Fore.YELLOW,
+            'ERROR': colorama.Fore.RED,
+            'CRITICAL': colorama.Fore.MAGENTA
+        }.items()
     }
-    RESET = colorama.Style.RESET_ALL
+    RESET = str(colorama.Style.RESET_ALL)
+
+    def __init__(self, *args, is_console=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_console = is_console
+        # JSON indentado para lectura en consola; una línea por registro en archivo
+        self._pretty_json = is_console
+        if is_console:
+            _init_color()
+        # Colorear solo en terminales interactivas y si NO_COLOR no está definido
+        self._use_color = (
+            is_console
+            and sys.stdout.isatty()
+            and 'NO_COLOR' not in os.environ
+        )
+        self._color_table = {
+            level: (color, self.RESET) for level, color in self.COLORS.items()
+        }
+        # Despacho por atributo del registro; el orden define la prioridad
+        self._payload_builders = {
+            'metrics': self._metrics_payload,
+            'system_info': self._system_info_payload,
+            'performance': self._performance_payload
+        }
 
     def format(self, record):
         # Añadir timestamp al mensaje si no existe
-        if not hasattr(record, 'timestamp'):
-            record.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        if 'timestamp' not in record.__dict__:
+            record.timestamp = _format_timestamp(record.created)
 
         # Formatear mensaje según el tipo
-        if hasattr(record, 'metrics'):
-            record.msg = self._format_metrics(record.metrics)
-        elif hasattr(record, 'system_info'):
-            record.msg = self._format_system_info(record.system_info)
-        elif hasattr(record, 'performance'):
-            record.msg = self._format_performance(record.performance)
+        payload = self._payload(record)
+        if payload is not None:
+            header, obj = payload
+            if self._pretty_json:
+                record.msg = header + _dumps(obj)
+            else:
+                record.msg = f"{header.rstrip()} {_dumps(obj, pretty=False)}"
 
         # Añadir colores solo para la consola
-        if hasattr(self, 'is_console'):
-            color = self.COLORS.get(record.levelname, self.RESET)
-            record.msg = f"{color}{record.msg}{self.RESET}"
+        if self._use_color:
+            color, reset = self._color_table.get(record.levelname, (self.RESET, self.RESET))
+            record.msg = f"{color}{record.msg}{reset}"
 
         return super().format(record)
 
-    def _format_metrics(self, metrics):
-        """Formatea las métricas de manera consistente"""
+    def format_bytes(self, record, encoding='utf-8'):
+        """Formatea un registro estructurado directamente a bytes con orjson.
+
+        Devuelve None si el registro no lleva datos estructurados, si orjson
+        no está instalado o si hay que colorear; en ese caso se usa format().
+        """
+        if orjson is None or self._use_color:
+            return None
+        payload = self._payload(record)
+        if payload is None:
+            return None
+
+        if 'timestamp' not in record.__dict__:
+            record.timestamp = _format_timestamp(record.created)
+        header, obj = payload
+        if self._pretty_json:
+            record.msg = header
+            option = _ORJSON_PRETTY_BYTES_OPTIONS
+        else:
+            record.msg = header.rstrip() + ' '
+            option = _ORJSON_BYTES_OPTIONS
+        prefix = super().format(record).encode(encoding)
+        return prefix + orjson.dumps(obj, option=option)
+
+    def _payload(self, record):
+        """Devuelve (encabezado, objeto) si el registro lleva datos estructurados"""
+        record_dict = record.__dict__
+        for attr, payload_builder in self._payload_builders.items():
+            if attr in record_dict:
+                return payload_builder(record_dict[attr])
+        return None
+
+    def _metrics_payload(self, metrics):
+        """Encabezado y datos de las métricas"""
         if 'type' in metrics and metrics['type'] == 'startup':
-            return f"Inicio del sistema - {json.dumps(metrics['system'], indent=2)}"
-        return f"Métricas del sistema:\n{json.dumps(metrics, indent=2)}"
+            return "Inicio del sistema - ", metrics['system']
+        return "Métricas del sistema:\n", metrics
+
+    def _system_info_payload(self, info):
+        """Encabezado y datos de la información del sistema"""
+        return "Sistema: ", info
+
+    def _performance_payload(self, perf):
+        """Encabezado y datos de rendimiento"""
+        return "Rendimiento del sistema:\n", perf
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler con buffer que agrupa las escrituras a disco"""
+    buffer_size = 64 * 1024
+    flush_interval = 1.0  # Segundos máximos entre volcados
+    flush_records = 64  # Registros pendientes que fuerzan un volcado
+
+    def __init__(self, filename, mode='w', encoding='utf-8'):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        # Un único hilo vuelca lo pendiente cuando no llegan registros nuevos
+        self._stop_flush = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _open(self):
+        """Abre el archivo en modo binario con un BufferedWriter sin volcado inmediato"""
+        return io.BufferedWriter(
+            io.FileIO(self.baseFilename, self.mode),
+            buffer_size=self.buffer_size
+        )
+
+    def emit(self, record):
+        """Escribe el registro en bytes y vuelca a disco por lotes o en errores"""
+        if self.stream is None:
+            # Igual que FileHandler.emit: un handler ya cerrado en modo 'w' no
+            # reabre el archivo, porque lo truncaría perdiendo la sesión
+            if self._closed and self.mode == 'w':
+                return
+            self.stream = self._open()
+        try:
+            data = None
+            if isinstance(self.formatter, CustomFormatter):
+                data = self.formatter.format_bytes(record, self.encoding)
+            if data is None:
+                msg = self.format(record) + self.terminator
+                data = msg.encode(self.encoding, self.errors or 'strict')
+            self.stream.write(data)
+            self._pending += 1
+            if (record.levelno >= logging.ERROR
+                    or self._pending >= self.flush_records
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()
+            self._pending = 0
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def _flush_loop(self):
+        """Vuelca periódicamente los registros pendientes mientras el handler siga abierto"""
+        while not self._stop_flush.wait(self.flush_interval):
+            if self._pending:
+                self.flush()
+
+    def close(self):
+        self._stop_flush.set()
+        super().close()
+
+# Atributos con los diccionarios de log_metrics, log_performance y el resumen del sistema
+_PAYLOAD_ATTRS = ('metrics', 'system_info', 'performance')
+
+class PassthroughQueueHandler(QueueHandler):
+    """QueueHandler que delega todo el formateo al hilo del listener.
+
+    El mensaje se formatea después y en otro hilo: los diccionarios del
+    registro se copian al encolarlo y el resto de argumentos deben ser
+    inmutables.
+    """
+    def prepare(self, record):
+        # La cola es en proceso: no hace falta pre-formatear ni serializar,
+        # pero el llamador puede seguir modificando los diccionarios (p. ej.
+        # la configuración del registro de arranque)
+        for attr in _PAYLOAD_ATTRS:
+            payload = record.__dict__.get(attr)
+            if payload is not None:
+                setattr(record, attr, copy.deepcopy(payload))
+        if isinstance(record.args, dict):
+            record.args = copy.deepcopy(record.args)
+        return record
+
+@functools.cache
+def _static_system_info():
+    """Información que no cambia durante la vida del proceso"""
+    info = {
+        "platform": {
+            "system": platform.system(),
+            "release": platform.release(),
+            "version": platform.version(),
+            "machine": platform.machine(),
+            "processor": platform.processor()
+        },
+        "python_version": sys.version,
+        "gpu": []
+    }
 
-    def _format_system_info(self, info):
-        """Formatea la información del sistema de manera consistente"""
-        return f"Sistema: {json.dumps(info, indent=2)}"
+    # Importación diferida: GPUtil solo se necesita para este resumen
+    try:
+        import GPUtil
+    except ImportError:
+        GPUtil = None
+
+    # Información de GPU (una sola consulta; la temperatura no es estática
+    # y la registra el monitor con cada muestra)
+    if GPUtil:
+        try:
+            info["gpu"] = [
+                {
+                    "name": gpu.name,
+                    "memory_total": gpu.memoryTotal,
+                    "driver": gpu.driver
+                }
+                for gpu in GPUtil.getGPUs()
+            ]
+        except Exception:
+            info["gpu"] = [{"message": "Error al obtener información de GPU"}]
+    else:
+        info["gpu"] = [{"message": "GPUtil no está instalado"}]
 
-    def _format_performance(self, perf):
-        """Formatea la información de rendimiento de manera consistente"""
-        return f"Rendimiento del sistema:\n{json.dumps(perf, indent=2)}"
+    return info
 
 class SystemMonitorLogger:
     _instance = None
     _logger = None
+    _listener = None
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -85,10 +330,14 @@ class SystemMonitorLogger:
 
         self.cleanup_old_logs()
 
-        # Crear logger principal
+        # Crear logger principal (idempotente si ya fue configurado)
         logger = logging.getLogger(self.app_name)
-        logger.setLevel(logging.DEBUG)
-        logger.handlers.clear()
+        if logger.handlers:
+            SystemMonitorLogger._logger = logger
+            return
+        # Por encima de DEBUG, las llamadas de depuración por ciclo se descartan
+        # antes de formatear nada
+        logger.setLevel(_level_from_env())
 
         # Timestamp para el nombre del archivo
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -99,44 +348,45 @@ class SystemMonitorLogger:
             '%(timestamp)s [%(levelname)s] %(module)s:%(lineno)d - %(message)s'
         )
         console_formatter = CustomFormatter(
-            '%(timestamp)s [%(levelname)s] %(message)s'
+            '%(timestamp)s [%(levelname)s] %(message)s',
+            is_console=True
         )
-        console_formatter.is_console = True
 
-        # File Handler (un archivo por sesión)
-        file_handler = logging.FileHandler(
+        # File Handler (un archivo por sesión, con escritura en buffer)
+        file_handler = BufferedFileHandler(
             log_file,
             mode='w',
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
 
         # Console Handler - Cambiar a DEBUG también para desarrollo
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(console_formatter)
         console_handler.is_console = True
-        logger.addHandler(console_handler)
+
+        # El logger solo encola; el listener escribe en segundo plano
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(PassthroughQueueHandler(log_queue))
+        listener = QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(shutdown_logging)
+        SystemMonitorLogger._listener = listener
 
         # Log inicial con información del sistema
         system_info = self.get_system_info()
         logger.info("=== Iniciando nueva sesión de monitoreo ===")
-        logger.info(f"Archivo de log: {log_file}")
-
-        # Usar un LogRecord personalizado para la información del sistema
-        record = logging.LogRecord(
-            name=logger.name,
-            level=logging.INFO,
-            pathname='',
-            lineno=0,
-            msg='',
-            args=(),
-            exc_info=None
-        )
-        record.system_info = system_info
-        logger.handle(record)
+        logger.info("Archivo de log: %s", log_file)
+
+        # Información del sistema como atributo extra del registro
+        logger.info('', extra={'system_info': system_info})
 
         SystemMonitorLogger._logger = logger
 
@@ -147,39 +397,39 @@ class SystemMonitorLogger:
     def log_metrics(self, metrics: dict):
         """Método específico para loguear métricas"""
         if self._logger:
-            record = logging.LogRecord(
-                name=self._logger.name,
-                level=logging.INFO,
-                pathname='',
-                lineno=0,
-                msg='',
-                args=(),
-                exc_info=None
-            )
-            record.metrics = metrics
-            self._logger.handle(record)
+            self._logger.info('', extra={'metrics': metrics})
 
     def get_system_info(self):
         """Recopila información detallada del sistema"""
+        static_info = _static_system_info()
+        dynamic_info = self._dynamic_system_info()
+        return {
+            "platform": static_info["platform"],
+            "python_version": static_info["python_version"],
+            "memory": dynamic_info["memory"],
+            "disk": dynamic_info["disk"],
+            "gpu": static_info["gpu"]
+        }
+
+    def _dynamic_system_info(self):
+        """Información que varía entre consultas (memoria y discos)"""
+        import psutil
+
+        vm = psutil.virtual_memory()
         info = {
-            "platform": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version(),
-                "machine": platform.machine(),
-                "processor": platform.processor()
-            },
-            "python_version": sys.version,
             "memory": {
-                "total": psutil.virtual_memory().total,
-                "available": psutil.virtual_memory().available
+                "total": vm.total,
+                "available": vm.available
             },
-            "disk": {},
-            "gpu": []
+            "disk": {}
         }
 
-        # Información de discos
-        for partition in psutil.disk_partitions():
+        # Información de discos (solo dispositivos físicos, sin pseudo-fs ni unidades ópticas)
+        for partition in psutil.disk_partitions(all=False):
+            if not partition.fstype or partition.fstype in PSEUDO_FILESYSTEMS:
+                continue
+            if 'cdrom' in partition.opts:
+                continue
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
                 info["disk"][partition.mountpoint] = {
@@ -190,72 +440,67 @@ class SystemMonitorLogger:
             except Exception:
                 pass
 
-        # Información de GPU
-        if GPUtil:
-            try:
-                gpus = GPUtil.getGPUs()
-                for gpu in gpus:
-                    info["gpu"].append({
-                        "name": gpu.name,
-                        "memory_total": gpu.memoryTotal,
-                        "driver": gpu.driver,
-                        "temperature": getattr(gpu, 'temperature', 'N/A')
-                    })
-            except Exception:
-                info["gpu"].append({"message": "Error al obtener información de GPU"})
-        else:
-            info["gpu"].append({"message": "GPUtil no está instalado"})
-
         return info
 
     def cleanup_old_logs(self):
         """Limpia logs antiguos manteniendo solo las sesiones más recientes"""
-        log_files = glob.glob(os.path.join(self.log_dir, f'{self.app_name}_*.log'))
-        if len(log_files) > self.max_sessions:
-            sorted_files = sorted(log_files, key=os.path.getctime)
-            for old_file in sorted_files[:-self.max_sessions]:
-                try:
-                    os.remove(old_file)
-                except Exception as e:
-                    print(f"Error eliminando log antiguo {old_file}: {e}")
+        prefix = f'{self.app_name}_'
+        with os.scandir(self.log_dir) as it:
+            log_entries = [
+                entry for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith('.log')
+            ]
+        if len(log_entries) <= self.max_sessions:
+            return
+
+        # DirEntry cachea el stat, evitando una segunda llamada por archivo
+        log_entries.sort(key=lambda entry: entry.stat().st_ctime_ns)
+        for old_entry in log_entries[:-self.max_sessions]:
+            try:
+                os.remove(old_entry.path)
+            except Exception as e:
+                print(f"Error eliminando log antiguo {old_entry.path}: {e}")
+
+# Loggers ya configurados por nombre de aplicación
+_LOGGER_CACHE = {}
 
 def get_logger(app_name="SystemMonitor"):
     """Función helper para obtener el logger"""
-    logger_instance = SystemMonitorLogger(app_name)
-    return logger_instance.get_logger()
+    logger = _LOGGER_CACHE.get(app_name)
+    if logger is None:
+        logger = _LOGGER_CACHE.setdefault(app_name, SystemMonitorLogger(app_name).get_logger())
+    return logger
+
+def shutdown_logging():
+    """Detiene el listener de logging escribiendo los registros pendientes"""
+    listener = SystemMonitorLogger._listener
+    if listener is None:
+        return
+    SystemMonitorLogger._listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
 
 def log_metrics(metrics: dict, app_name="SystemMonitor"):
     """Función helper para loguear métricas"""
-    logger_instance = SystemMonitorLogger(app_name)
-    logger_instance.log_metrics(metrics)
+    logger = get_logger(app_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('', extra={'metrics': metrics})
 
 def log_performance(perf: dict, app_name="SystemMonitor"):
     """Función helper para loguear información de rendimiento"""
-    logger_instance = SystemMonitorLogger(app_name)
-    if logger_instance._logger:
-        record = logging.LogRecord(
-            name=logger_instance._logger.name,
-            level=logging.DEBUG,
-            pathname='',
-            lineno=0,
-            msg='',
-            args=(),
-            exc_info=None
-        )
-        record.performance = perf
-        logger_instance._logger.handle(record)
+    logger = get_logger(app_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('', extra={'performance': perf})
 
-def log_error(error: str, exc_info=None, app_name="SystemMonitor"):
+def log_error(error: str, *args, exc_info=None, app_name="SystemMonitor"):
     """Función helper para loguear errores de manera consistente"""
-    logger = get_logger(app_name)
-    logger.error(error, exc_info=exc_info)
+    get_logger(app_name).error(error, *args, exc_info=exc_info)
 
-def log_warning(msg: str, app_name="SystemMonitor"):
+def log_warning(msg: str, *args, app_name="SystemMonitor"):
     """Función helper para loguear advertencias de manera consistente"""
-    logger = get_logger(app_name)
-    logger.warning(msg)
+    get_logger(app_name).warning(msg, *args)
 
-def log_debug(msg: str, app_name="SystemMonitor"):
+def log_debug(msg: str, *args, app_name="SystemMonitor"):
     """Función helper para loguear información de depuración"""
-    logger = get_logger(app_name)
-    logger.debug(msg)
+    get_logger(app_name).debug(msg, *args)
@@ -1,34 +1,32 @@
 import customtkinter as ctk
 import psutil
-import threading
-from datetime import datetime, timedelta
-from plyer import notification
+from datetime import datetime
 import platform
 import os
 import sys
-from collections import deque
 import time
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
-import glob
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from logger_config import (
     get_logger,
     log_metrics,
     log_performance,
     log_error,
     log_warning,
-    log_debug
+    log_debug,
+    shutdown_logging
 )
-import cProfile
 import io
-import pstats
-from functools import wraps
-from typing import Deque, Callable, Optional, Any, Dict
+from functools import lru_cache, partial, wraps
+from typing import Callable, Optional, Any, Dict
 import numpy as np
 from dataclasses import dataclass
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread, get_native_id
+import queue
 import tkinter.messagebox as messagebox
 import tkinter as tk
 
@@ -50,6 +48,88 @@ THEME = {
     }
 }
 
+@lru_cache(maxsize=128)
+def _brighten(hex_color: str, factor: float) -> str:
+    """Ajusta el brillo de un color '#rrggbb' operando sobre el entero RGB"""
+    v = int(hex_color.lstrip('#'), 16)
+    r = min(255, int((v >> 16) * factor))
+    g = min(255, int(((v >> 8) & 0xff) * factor))
+    b = min(255, int((v & 0xff) * factor))
+    return '#%06x' % (r << 16 | g << 8 | b)
+
+# Variantes hover fijas del tema, calculadas una sola vez al importar
+THEME['primary_hover'] = _brighten(THEME['primary'], 0.8)
+THEME['card_bg_hover'] = _brighten(THEME['card_bg'], 1.1)
+
+# Fuentes compartidas por tamaño y peso; se crean al primer uso porque CTkFont
+# necesita una raíz Tk existente
+_FONT_CACHE = {}
+
+def get_font(size: int, bold: bool = False) -> ctk.CTkFont:
+    """Devuelve la CTkFont 'Segoe UI' compartida para un tamaño y peso"""
+    key = (size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(
+            family='Segoe UI', size=size, weight='bold' if bold else 'normal'
+        )
+    return font
+
+def _clamp3(cpu: float, ram: float, gpu: float) -> tuple[float, float, float]:
+    """Limita las tres lecturas a 0-100 y las devuelve siempre como float"""
+    return (
+        min(100.0, max(0.0, float(cpu))),
+        min(100.0, max(0.0, float(ram))),
+        min(100.0, max(0.0, float(gpu))),
+    )
+
+# Segundos entre lecturas de datos que cambian lentamente (memoria/temperatura de GPU)
+SLOW_METRICS_INTERVAL = 5.0
+
+# Milisegundos entre comprobaciones de nuevas muestras desde el hilo de la UI
+UI_REFRESH_MS = 250
+
+# Milisegundos sin cambios en el intervalo antes de guardar la configuración
+SETTINGS_SAVE_DELAY_MS = 500
+
+# Muestras recientes cuya media debe superar el umbral para notificar
+THRESHOLD_WINDOW = 5
+
+# Milisegundos sin cambios en un umbral antes de registrarlo
+THRESHOLD_LOG_DELAY_MS = 200
+
+# Segundos entre registros periódicos de métricas y rendimiento
+METRICS_LOG_INTERVAL = 60
+
+# Segundos mínimos entre redibujados del gráfico (el blit es barato)
+GRAPH_MIN_DRAW_INTERVAL = 0.1
+
+# Margen del eje X en segundos y holgura a la derecha como fracción de la
+# ventana visible; mientras los datos caben no se redibuja el fondo
+GRAPH_X_MARGIN = 5.0
+GRAPH_X_HEADROOM = 0.25
+
+# Intervalo máximo de muestreo en reposo: mientras todas las métricas estén por
+# debajo de la mitad de su umbral, el intervalo se duplica hasta este límite
+IDLE_MAX_INTERVAL = 5.0
+
+# Notificaciones pendientes como máximo; al llenarse se descarta la más antigua
+NOTIFICATION_QUEUE_SIZE = 8
+
+# Segundos durante los que se reutiliza la lectura de psutil.cpu_freq()
+CPU_FREQ_TTL = 1.0
+
+# Plantillas de los textos informativos de las tarjetas
+CPU_FREQ_TEMPLATE = "Frecuencia: %.0fMHz"
+GPU_MEMORY_TEMPLATE = "Memoria: %.0fMB/%.0fMB"
+GPU_TEMP_TEMPLATE = " | Temp: %s°C"
+
+# Directorio de sysfs con la frecuencia de cada CPU (solo Linux)
+SYSFS_CPU_DIR = '/sys/devices/system/cpu'
+
+# Unidad cuyo uso de disco se consulta, resuelta una sola vez al importar
+DISK_ROOT = 'C:\\' if platform.system() == 'Windows' else '/'
+
 try:
     import GPUtil
     GPU_AVAILABLE = True
@@ -57,8 +137,35 @@ except ImportError:
     GPU_AVAILABLE = False
     print("GPUtil no está disponible. La monitorización de GPU estará desactivada.")
 
+# NVML (nvidia-ml-py) es opcional: si está, el uso y la temperatura de la GPU se
+# leen con llamadas directas a la biblioteca en lugar de lanzar nvidia-smi
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    NVML_AVAILABLE = False
+
+def _lower_thread_priority() -> None:
+    """Baja la prioridad del hilo que la llama para no competir con la carga real"""
+    try:
+        if sys.platform.startswith('linux'):
+            # En Linux la política y el valor nice son por hilo
+            os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+            os.setpriority(os.PRIO_PROCESS, get_native_id(), 10)
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            THREAD_PRIORITY_BELOW_NORMAL = -1
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_BELOW_NORMAL)
+    except (OSError, AttributeError):
+        pass
+
 class UIFactory:
     """Clase utilitaria para crear widgets de UI consistentes"""
+    # Tooltip único de la aplicación: se crea una vez y se oculta con withdraw()
+    _tooltip: Optional[tk.Toplevel] = None
+    _tooltip_label: Optional[tk.Label] = None
+
     @staticmethod
     def create_button(
         master: Any,
@@ -76,7 +183,9 @@ class UIFactory:
             command=command,
             width=width,
             fg_color=fg_color or THEME['primary'],
-            hover_color=hover_color or UIFactory.apply_brightness(fg_color or THEME['primary'], 0.8),
+            hover_color=hover_color or (
+                UIFactory.apply_brightness(fg_color, 0.8) if fg_color else THEME['primary_hover']
+            ),
             **kwargs
         )
 
@@ -90,11 +199,10 @@ class UIFactory:
         **kwargs
     ) -> ctk.CTkLabel:
         """Crea una etiqueta con estilo consistente"""
-        font = ('Segoe UI', font_size, 'bold') if bold else ('Segoe UI', font_size)
         return ctk.CTkLabel(
             master,
             text=text,
-            font=font,
+            font=get_font(font_size, bold),
             text_color=text_color or THEME['text'],
             **kwargs
         )
@@ -130,36 +238,40 @@ class UIFactory:
     @staticmethod
     def apply_brightness(hex_color: str, factor: float) -> str:
         """Ajusta el brillo de un color hexadecimal"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        new_rgb = tuple(min(255, int(c * factor)) for c in rgb)
-        return '#{:02x}{:02x}{:02x}'.format(*new_rgb)
+        return _brighten(hex_color, factor)
 
-    @staticmethod
+    @classmethod
     def create_tooltip(
+        cls,
         widget: Any,
         text: str,
         background: Optional[str] = None,
         foreground: Optional[str] = None
-    ) -> None:
-        """Agrega un tooltip a un widget"""
-        tooltip = tk.Toplevel(widget)
-        tooltip.wm_overrideredirect(True)
-        tooltip.wm_geometry(f"+{widget.winfo_rootx() + widget.winfo_width() + 5}+{widget.winfo_rooty() + 5}")
+    ) -> tk.Toplevel:
+        """Muestra el tooltip compartido junto a un widget"""
+        tooltip = cls._tooltip
+        if tooltip is None or not tooltip.winfo_exists():
+            tooltip = tk.Toplevel(widget.winfo_toplevel())
+            tooltip.wm_overrideredirect(True)
+            cls._tooltip_label = tk.Label(
+                tooltip,
+                justify='left',
+                relief='solid',
+                borderwidth=1,
+                padx=8,
+                pady=4,
+                font=('Segoe UI', 10)
+            )
+            cls._tooltip_label.pack()
+            cls._tooltip = tooltip
 
-        label = tk.Label(
-            tooltip,
+        cls._tooltip_label.configure(
             text=text,
-            justify='left',
             background=background or THEME['card_bg'],
-            foreground=foreground or THEME['text'],
-            relief='solid',
-            borderwidth=1,
-            padx=8,
-            pady=4,
-            font=('Segoe UI', 10)
+            foreground=foreground or THEME['text']
         )
-        label.pack()
+        tooltip.wm_geometry(f"+{widget.winfo_rootx() + widget.winfo_width() + 5}+{widget.winfo_rooty() + 5}")
+        tooltip.deiconify()
         return tooltip
 
 @dataclass
@@ -168,31 +280,58 @@ class MetricData:
     timestamp: float
     value: float
 
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Lecturas de un ciclo de muestreo, tomadas y publicadas juntas"""
+    timestamp: float
+    cpu: float
+    ram: float
+    gpu: float
+    vmem: Any
+    gpu_info: Optional[dict]
+
 class PerformanceMonitor:
-    """Clase para monitorear el rendimiento de la aplicación"""
+    """Clase para monitorear el rendimiento de la aplicación.
+
+    cProfile instrumenta cada llamada de Python, así que el perfilado solo se
+    activa si está definida la variable de entorno MONITOR_CPROFILE.
+    """
     def __init__(self, logger):
-        self.profiler = cProfile.Profile()
+        self.profiler = None
         self.logger = logger
+        self.enabled = bool(os.getenv('MONITOR_CPROFILE'))
         self.is_profiling = False
         self._lock = Lock()
 
     def start_profiling(self):
+        # Comprobación sin lock para el caso habitual (perfilado desactivado)
+        if not self.enabled or self.is_profiling:
+            return
         with self._lock:
             if not self.is_profiling:
+                import cProfile
+                self.profiler = cProfile.Profile()
                 self.profiler.enable()
                 self.is_profiling = True
                 self.logger.debug("Iniciando perfilado de rendimiento")
 
     def stop_profiling(self):
+        if not self.is_profiling:
+            return
+        # El lock solo protege el cambio de estado; el formateo va fuera
         with self._lock:
-            if self.is_profiling:
-                self.profiler.disable()
-                s = io.StringIO()
-                stats = pstats.Stats(self.profiler, stream=s).sort_stats('cumulative')
-                stats.print_stats(20)  # Mostrar las 20 funciones más costosas
-                self.logger.debug(f"Resultados del perfilado:\n{s.getvalue()}")
-                self.profiler = cProfile.Profile()  # Reset profiler
-                self.is_profiling = False
+            if not self.is_profiling:
+                return
+            profiler = self.profiler
+            profiler.disable()
+            self.profiler = None
+            self.is_profiling = False
+
+        import pstats
+        s = io.StringIO()
+        stats = pstats.Stats(profiler, stream=s).sort_stats('cumulative')
+        stats.print_stats(20)  # Mostrar las 20 funciones más costosas
+        self.logger.debug("Resultados del perfilado:\n%s", s.getvalue())
 
 def performance_monitor(func):
     """Decorador para monitorear el rendimiento de funciones específicas"""
@@ -206,54 +345,99 @@ def performance_monitor(func):
         logger = args[0].logger if hasattr(args[0], 'logger') else get_logger()
 
         if execution_time > 0.1:  # Log solo si toma más de 100ms
-            logger.debug(f"Rendimiento: {func.__name__} tomó {execution_time:.3f} segundos")
+            logger.debug("Rendimiento: %s tomó %.3f segundos", func.__name__, execution_time)
         return result
     return wrapper
 
 class OptimizedMetricStorage:
-    """Clase para manejar el almacenamiento optimizado de métricas"""
-    def __init__(self, max_points: int = 60):
+    """Clase para manejar el almacenamiento optimizado de métricas.
+
+    Buffer circular sin lock: un único hilo escribe (add_metric) y el hilo de
+    la UI lee. La escritura se publica con un solo store de current_index,
+    atómico bajo el GIL, y los lectores reintentan si el índice cambió
+    mientras copiaban.
+    """
+    def __init__(self, max_points: int = 60, track_timestamps: bool = True):
         self.max_points = max_points
-        # Usar arrays de numpy para mejor rendimiento
-        self.timestamps = np.zeros(max_points)
-        self.values = np.zeros(max_points)
+        # Usar arrays de numpy para mejor rendimiento. Los buffers que
+        # comparten reloj con otro pueden omitir sus timestamps. Sin inicializar:
+        # solo se lee lo ya escrito (hasta current_index o el buffer lleno)
+        self.timestamps = np.empty(max_points) if track_timestamps else None
+        # Porcentajes 0-100: float32 sobra para la precisión mostrada (0.1%)
+        self.values = np.empty(max_points, dtype=np.float32)
         self.current_index = 0
         self.is_filled = False
-        self._lock = Lock()
+        # Buffers de salida reutilizados al leer el buffer ya lleno
+        self._out_timestamps = np.empty(max_points) if track_timestamps else None
+        self._out_values = np.empty(max_points, dtype=np.float32)
 
-    def add_metric(self, value: float, timestamp: float = None):
-        with self._lock:
-            if timestamp is None:
-                timestamp = time.time()
+    def __len__(self) -> int:
+        return self.max_points if self.is_filled else self.current_index
 
-            self.timestamps[self.current_index] = timestamp
-            self.values[self.current_index] = value
-
-            self.current_index = (self.current_index + 1) % self.max_points
-            if self.current_index == 0:
-                self.is_filled = True
+    def add_metric(self, value: float, timestamp: float = None):
+        index = self.current_index
+        if self.timestamps is not None:
+            self.timestamps[index] = time.time() if timestamp is None else timestamp
+        self.values[index] = value
+
+        next_index = index + 1
+        if next_index == self.max_points:
+            next_index = 0
+            # Marcar lleno antes de publicar el índice 0
+            self.is_filled = True
+        self.current_index = next_index
 
     def get_values(self) -> np.ndarray:
-        with self._lock:
-            if self.is_filled:
-                return np.roll(self.values, -self.current_index)
-            return self.values[:self.current_index]
+        return self._snapshot(self.values, self._out_values)
+
+    def recent_mean(self, n: int) -> float:
+        """Media de las últimas n muestras, sin copiar el buffer (0.0 si está vacío)"""
+        index = self.current_index
+        count = min(n, self.max_points if self.is_filled else index)
+        if count == 0:
+            return 0.0
+        start = index - count
+        if start >= 0:
+            return float(self.values[start:index].mean())
+        # La ventana cruza el final del buffer circular
+        return float((self.values[start:].sum() + self.values[:index].sum()) / count)
+
+    def get_timestamps(self) -> Optional[np.ndarray]:
+        if self.timestamps is None:
+            return None
+        return self._snapshot(self.timestamps, self._out_timestamps)
 
-    def get_timestamps(self) -> np.ndarray:
-        with self._lock:
+    def _snapshot(self, data: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Devuelve los datos en orden cronológico, reintentando una vez si hubo escritura.
+
+        Con el buffer lleno se copia en `out` (reutilizado entre llamadas), así
+        que el resultado solo es válido hasta la siguiente lectura.
+        """
+        for _ in range(2):
+            index = self.current_index
             if self.is_filled:
-                return np.roll(self.timestamps, -self.current_index)
-            return self.timestamps[:self.current_index]
+                tail = self.max_points - index
+                np.copyto(out[:tail], data[index:])
+                np.copyto(out[tail:], data[:index])
+                result = out
+            else:
+                result = data[:index]
+            if self.current_index == index:
+                break
+        return result
 
     def clear(self):
-        with self._lock:
-            # Más eficiente que crear nuevos arrays
-            self.timestamps.fill(0)
-            self.values.fill(0)
-            self.current_index = 0
-            self.is_filled = False
+        # Basta con reiniciar los índices: las lecturas nunca pasan de lo escrito
+        self.is_filled = False
+        self.current_index = 0
 
 class Settings:
+    __slots__ = (
+        'config_file', 'default_settings', 'settings',
+        # Copias planas de los valores consultados en cada ciclo
+        'update_interval', 'show_graph', 'show_notifications'
+    )
+
     def __init__(self):
         self.config_file = 'config.json'
         self.default_settings = {
@@ -273,26 +457,38 @@ class Settings:
             }
         }
         self.settings = self.load_settings()
+        self.refresh_cache()
+
+    def refresh_cache(self):
+        """Copia los valores más consultados del diccionario a atributos planos"""
+        settings = self.settings
+        self.update_interval = settings['update_interval']
+        self.show_graph = settings['graph']['show']
+        self.show_notifications = settings['show_notifications']
 
     def load_settings(self):
         try:
             if os.path.exists(self.config_file):
-                loaded_settings = json.load(open(self.config_file, 'r'))
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                loaded_settings = orjson.loads(data) if orjson else json.loads(data)
                 # Asegurarse de que no existe 'disk' en los thresholds
-                if 'thresholds' in loaded_settings:
-                    loaded_settings['thresholds'] = {
-                        k: v for k, v in loaded_settings['thresholds'].items()
-                        if k in ['cpu', 'ram', 'gpu']
-                    }
+                loaded_settings.get('thresholds', {}).pop('disk', None)
                 return {**self.default_settings, **loaded_settings}
             return self.default_settings.copy()
         except Exception:
             return self.default_settings.copy()
 
     def save_settings(self):
+        self.refresh_cache()
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            if orjson:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                # Mismo formato que orjson: el archivo no depende de si está instalado
+                data = json.dumps(self.settings, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             print(f"Error saving settings: {e}")
 
@@ -301,12 +497,13 @@ class CustomizationPanel(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.settings = settings
         self.on_settings_change = on_settings_change
+        self._save_after = None
 
         # Título
         title = ctk.CTkLabel(
             self,
             text="General Settings",
-            font=('Segoe UI', 20, 'bold')
+            font=get_font(20, bold=True)
         )
         title.pack(pady=(0,20))
 
@@ -322,7 +519,7 @@ class CustomizationPanel(ctk.CTkFrame):
         interval_title = ctk.CTkLabel(
             interval_frame,
             text="Update Interval",
-            font=('Segoe UI', 14, 'bold')
+            font=get_font(14, bold=True)
         )
         interval_title.pack(side='top', anchor='w')
 
@@ -333,14 +530,14 @@ class CustomizationPanel(ctk.CTkFrame):
         self.interval_label = ctk.CTkLabel(
             value_frame,
             text="Current: 1.0s",
-            font=('Segoe UI', 12)
+            font=get_font(12)
         )
         self.interval_label.pack(side='left')
 
         interval_desc = ctk.CTkLabel(
             value_frame,
             text="(0.1s - 5.0s)",
-            font=('Segoe UI', 10),
+            font=get_font(10),
             text_color='gray'
         )
         interval_desc.pack(side='right')
@@ -391,7 +588,7 @@ class CustomizationPanel(ctk.CTkFrame):
         graph_title = ctk.CTkLabel(
             graph_frame,
             text="Graph Settings",
-            font=('Segoe UI', 14, 'bold')
+            font=get_font(14, bold=True)
         )
         graph_title.pack(anchor='w', pady=(0,10))
 
@@ -401,7 +598,7 @@ class CustomizationPanel(ctk.CTkFrame):
             text="Show Graph",
             variable=self.show_graph_var,
             command=self._on_graph_toggle,
-            font=('Segoe UI', 12)
+            font=get_font(12)
         )
         show_graph_cb.pack(anchor='w')
 
@@ -416,7 +613,7 @@ class CustomizationPanel(ctk.CTkFrame):
         notif_title = ctk.CTkLabel(
             notif_frame,
             text="Notifications",
-            font=('Segoe UI', 14, 'bold')
+            font=get_font(14, bold=True)
         )
         notif_title.pack(anchor='w', pady=(0,10))
 
@@ -426,7 +623,7 @@ class CustomizationPanel(ctk.CTkFrame):
             text="Show Notifications",
             variable=self.show_notif_var,
             command=self._on_notifications_toggle,
-            font=('Segoe UI', 12)
+            font=get_font(12)
         )
         show_notif_cb.pack(anchor='w')
 
@@ -444,6 +641,13 @@ class CustomizationPanel(ctk.CTkFrame):
         formatted_value = self._format_interval(float(value))
         self.interval_label.configure(text=f"Current: {formatted_value}")
         self.settings.settings['update_interval'] = float(value)
+        # Guardar y aplicar una sola vez cuando el slider deja de moverse
+        if self._save_after:
+            self.after_cancel(self._save_after)
+        self._save_after = self.after(SETTINGS_SAVE_DELAY_MS, self._commit_interval)
+
+    def _commit_interval(self):
+        self._save_after = None
         self.settings.save_settings()
         self.on_settings_change()
 
@@ -490,7 +694,11 @@ class MetricCard(ctk.CTkFrame):
         self.tooltip_text = tooltip_text
         self.metric_color = metric_color or THEME['primary']
         self._last_value = 0
+        self._shown_value = 0.0
+        self._info_text = ""
         self._animation_after_id = None
+        # Callback de animación enlazado una sola vez y reutilizado en cada paso
+        self._anim_cb = self._anim_tick
         self._setup_ui(title)
         self._setup_events()
 
@@ -542,7 +750,7 @@ class MetricCard(ctk.CTkFrame):
 
     def _on_enter(self, event: Any) -> None:
         """Maneja el evento de entrada del mouse"""
-        self.configure(fg_color=UIFactory.apply_brightness(THEME['card_bg'], 1.1))
+        self.configure(fg_color=THEME['card_bg_hover'])
         if self.tooltip_text:
             self.tooltip = UIFactory.create_tooltip(self, self.tooltip_text)
 
@@ -550,11 +758,17 @@ class MetricCard(ctk.CTkFrame):
         """Maneja el evento de salida del mouse"""
         self.configure(fg_color=THEME['card_bg'])
         if self.tooltip:
-            self.tooltip.destroy()
+            self.tooltip.withdraw()
             self.tooltip = None
 
     def update(self, value: float, info_text: Optional[str] = None) -> None:
         """Actualiza los valores de la tarjeta con animación optimizada"""
+        # Nada visible cambia: evitar cancelar la animación y cualquier configure
+        if (round(value, 1) == round(self._last_value, 1) and
+                (info_text is None or info_text == self._info_text)):
+            self._last_value = value
+            return
+
         # Cancelar animación anterior si existe
         if self._animation_after_id:
             self.after_cancel(self._animation_after_id)
@@ -564,36 +778,46 @@ class MetricCard(ctk.CTkFrame):
         if abs(value - self._last_value) > 0.5:
             self._animate_value(self._last_value, value)
         else:
-            self.value_label.configure(text=f"{value:.1f}%")
-            self.progress.set(value/100.0)
+            self._show_value(value)
 
         self._last_value = value
 
-        # Actualizar información adicional si se proporciona
-        if info_text:
+        # Actualizar información adicional si se proporciona y cambió
+        if info_text and info_text != self._info_text:
+            self._info_text = info_text
             self.info_label.configure(text=info_text)
 
+    def _show_value(self, value: float) -> None:
+        """Muestra el valor redondeado a una décima, sin tocar los widgets si no cambió"""
+        shown = round(value, 1)
+        if shown == self._shown_value:
+            return
+        self._shown_value = shown
+        self.value_label.configure(text=f"{shown:.1f}%")
+        self.progress.set(shown / 100.0)
+
     def _animate_value(self, start: float, end: float, duration: float = 0.2) -> None:
         """Animación optimizada del valor"""
         steps = 8
         step_size = (end - start) / steps
-        step_duration = int((duration * 1000) / steps)
-
-        def update_step(step: int) -> None:
-            if step < steps:
-                current = start + (step_size * step)
-                self.value_label.configure(text=f"{current:.1f}%")
-                self.progress.set(current/100.0)
-                self._animation_after_id = self.after(
-                    step_duration,
-                    lambda: update_step(step + 1)
-                )
-            else:
-                self.value_label.configure(text=f"{end:.1f}%")
-                self.progress.set(end/100.0)
-                self._animation_after_id = None
 
-        update_step(0)
+        # Fotogramas precalculados; un único callback los recorre por índice
+        self._anim_frames = [start + step_size * step for step in range(steps)]
+        self._anim_frames.append(end)
+        self._anim_index = 0
+        self._anim_step_ms = int((duration * 1000) / steps)
+        self._anim_tick()
+
+    def _anim_tick(self) -> None:
+        """Muestra el fotograma actual y programa el siguiente"""
+        index = self._anim_index
+        self._show_value(self._anim_frames[index])
+        index += 1
+        if index < len(self._anim_frames):
+            self._anim_index = index
+            self._animation_after_id = self.after(self._anim_step_ms, self._anim_cb)
+        else:
+            self._animation_after_id = None
 
 class ThresholdControl(ctk.CTkFrame):
     """Control optimizado para manejar umbrales de recursos"""
@@ -648,11 +872,11 @@ class ThresholdControl(ctk.CTkFrame):
             number_of_steps=100,
             progress_color=self.colors['primary'],
             button_color=self.colors['primary'],
-            button_hover_color=UIFactory.apply_brightness(self.colors['primary'], 0.8)
+            button_hover_color=UIFactory.apply_brightness(self.colors['primary'], 0.8),
+            command=self._on_slider_change
         )
         self.slider.grid(row=0, column=1, padx=5, sticky="ew")
         self.slider.set(initial_value)
-        self.slider.bind('<ButtonRelease-1>', self._on_slider_release)
 
         # Botón incrementar
         self.increase_btn = UIFactory.create_button(
@@ -692,15 +916,14 @@ class ThresholdControl(ctk.CTkFrame):
     def _update_value(self, value: float) -> None:
         """Actualiza el valor del control y notifica el cambio"""
         self.slider.set(value)
+        self._on_slider_change(value)
+
+    def _on_slider_change(self, value: float) -> None:
+        """Refleja el valor del slider y notifica el cambio"""
         self.value_label.configure(text=f"{value:.0f}%")
         if self.on_change:
             self.on_change(value)
 
-    def _on_slider_release(self, event: Any) -> None:
-        """Maneja el evento de soltar el slider"""
-        value = self.slider.get()
-        self._update_value(value)
-
     def get(self) -> float:
         """Obtiene el valor actual del control"""
         return self.slider.get()
@@ -713,6 +936,9 @@ class MonitorApp(ctk.CTk):
         # Inicializar logger
         self.logger = get_logger()
 
+        # Fijar la referencia de cpu_percent para que la primera muestra no sea 0.0
+        psutil.cpu_percent(interval=None)
+
         # Cargar configuración
         self.settings = Settings()
         self.colors = THEME
@@ -729,6 +955,7 @@ class MonitorApp(ctk.CTk):
 
         # Inicializar monitor de rendimiento
         self.performance_monitor = PerformanceMonitor(self.logger)
+        self.performance_monitor.start_profiling()
 
         # Configuración de la ventana y componentes
         self._setup_window()
@@ -750,7 +977,7 @@ class MonitorApp(ctk.CTk):
 
         self.configure(fg_color=self.colors['background'])
         ctk.set_appearance_mode("dark" if self.settings.settings['theme'] == 'dark' else "light")
-        log_debug(f"Tema configurado: {self.settings.settings['theme']}")
+        log_debug("Tema configurado: %s", self.settings.settings['theme'])
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.bind("<Configure>", self.on_resize)
@@ -787,8 +1014,10 @@ class MonitorApp(ctk.CTk):
         """Inicializa el almacenamiento de métricas"""
         self.max_data_points = self.settings.settings['max_data_points']
         self.cpu_metrics = OptimizedMetricStorage(self.max_data_points)
-        self.ram_metrics = OptimizedMetricStorage(self.max_data_points)
-        self.gpu_metrics = OptimizedMetricStorage(self.max_data_points)
+        # RAM y GPU se muestrean junto con la CPU: el gráfico usa solo los
+        # timestamps de cpu_metrics, así que no se duplican
+        self.ram_metrics = OptimizedMetricStorage(self.max_data_points, track_timestamps=False)
+        self.gpu_metrics = OptimizedMetricStorage(self.max_data_points, track_timestamps=False)
 
         # Control de errores y rendimiento
         self.last_update = {
@@ -796,29 +1025,131 @@ class MonitorApp(ctk.CTk):
             'ram': 0,
             'gpu': 0
         }
-        self.update_threshold = 0.5
         self.last_update_time = time.time()
-        self.update_interval = max(0.5, self.settings.settings['update_interval'])
+        # cpu_percent(interval=None) no bloquea: el ritmo lo marca solo el intervalo
+        self.update_interval = self.settings.update_interval
         self.skip_updates = 0
 
+        # Caché de datos de GPU que se refrescan con menor frecuencia
+        self._gpu_info = None
+        self._gpu_info_time = float('-inf')
+        # Nombre y memoria total de la GPU, leídos la primera vez
+        self._gpu_static = None
+        # Última lista de GPUtil.getGPUs() y su instante (time.monotonic());
+        # cada llamada lanza nvidia-smi, así que se comparte dentro del intervalo
+        # de muestreo vigente (_poll_interval)
+        self._gpu_cache = (float('-inf'), None)
+
+        # Última lectura de psutil.cpu_freq() y su instante (time.monotonic())
+        self._cpu_freq_cache = (float('-inf'), None)
+        # Frecuencias mínima y máxima de la CPU, leídas la primera vez
+        self._cpu_freq_static = None
+        # Descriptores de scaling_cur_freq abiertos una vez (vacío si no hay sysfs).
+        # Los leen el hilo de la UI y el del sampler: el lock cubre cada lectura
+        # y el cierre, así nunca se cierra (ni dos veces) un fd en uso
+        self._cpu_freq_lock = Lock()
+        self._cpu_freq_fds = self._open_cpu_freq_fds()
+
+        # La RAM total no cambia durante la sesión
+        self._ram_total_gb = psutil.virtual_memory().total / (1024**3)
+        self._ram_template = "Usado: %%.1fGB de %.1fGB" % self._ram_total_gb
+
+        # Fallos persistentes ya registrados con traza completa
+        self._logged_once = set()
+
+        # Detectar la GPU una sola vez: sin GPU NVIDIA, GPUtil lanzaría
+        # nvidia-smi en cada muestra solo para obtener una lista vacía
+        self._nvml_handle = self._init_nvml()
+        # Si la versión de GPUtil expone la temperatura (se comprueba al detectar)
+        self._gpu_has_temp = False
+        self.gpu_present = self._nvml_handle is not None or self._detect_gpu()
+
     def _setup_notifications(self) -> None:
         """Configura el sistema de notificaciones"""
         self.thresholds = self.settings.settings['thresholds']
-        self.last_notifications = {
-            'cpu': datetime.min,
-            'ram': datetime.min,
-            'gpu': datetime.min
-        }
-        self.notification_cooldown = {}
+        self._threshold_log_jobs = {}
+        # notify() del backend de plyer, resuelto con la primera notificación
+        self._notify = None
+        # Copia local de la preferencia; apply_settings la mantiene al día
+        self._show_notifications = self.settings.show_notifications
+        # Las notificaciones se envían desde un hilo propio: un backend lento
+        # de plyer no debe bloquear el bucle de Tk
+        self._notif_q = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        Thread(target=self._notif_worker, name='notifier', daemon=True).start()
+        # Umbrales y última muestra como vectores fijos (cpu, ram, gpu) para
+        # compararlos en una sola operación en check_thresholds
+        self._threshold_resources = (
+            ('cpu', self.cpu_metrics),
+            ('ram', self.ram_metrics),
+            ('gpu', self.gpu_metrics),
+        )
+        # Nombre y plantilla del aviso de cada recurso, en el mismo orden
+        self._alert_templates = tuple(
+            (resource.upper(), f"{resource.upper()} uso alto: %.1f%%")
+            for resource, _ in self._threshold_resources
+        )
+        self._thresh_arr = np.empty(3, dtype=np.float32)
+        self._last_vals = np.empty(3, dtype=np.float32)
+        self._refresh_threshold_array()
         self.grace_period = self.settings.settings['notification_grace_period']
+        self._grace_period_ns = int(self.grace_period * 1e9)
+        # Última notificación por recurso (mismo orden que _thresh_arr), en
+        # nanosegundos de time.monotonic_ns(); el valor inicial ya está fuera
+        # del periodo de gracia
+        self.notification_cooldown = np.full(3, -self._grace_period_ns - 1, dtype=np.int64)
 
     def _start_monitoring(self) -> None:
         """Inicia el monitoreo del sistema"""
-        self.running = True
-        self.thread = threading.Thread(target=self.update_stats, daemon=True)
-        self.thread.start()
+        # Señal de cierre compartida entre el hilo de Tk y el del sampler
+        self._stop_event = Event()
+        # Tk marca el ritmo de muestreo; las lecturas bloqueantes (GPUtil lanza
+        # nvidia-smi) se hacen en un único hilo de trabajo y la UI se actualiza
+        # desde el hilo principal en _ui_tick
+        self._latest_sample = None
+        self._shown_sample = None
+        self._checked_sample = None
+        self._sample_future = None
+        # Intervalo efectivo: update_interval con carga, mayor en reposo
+        self._poll_interval = self.update_interval
+        self._error_count = 0
+        self._last_log_time = 0.0
+        # Métodos de inserción resueltos una vez; los buffers no se reemplazan
+        self._metric_writers = (
+            self.cpu_metrics.add_metric,
+            self.ram_metrics.add_metric,
+            self.gpu_metrics.add_metric
+        )
+        self._sampler = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='sampler',
+            initializer=_lower_thread_priority
+        )
+        self.logger.info("Iniciando monitoreo de recursos")
+        self.after(int(self.update_interval * 1000), self._schedule_sample)
+        self.after(0, self._ui_tick)
         self.logger.info("Monitor iniciado correctamente")
 
+    def _ui_tick(self) -> None:
+        """Muestra la última muestra publicada por el hilo de monitoreo"""
+        if self._stop_event.is_set():
+            return
+
+        sample = self._latest_sample
+        if sample is not None:
+            # Los umbrales se vigilan aunque la ventana no se vea
+            if sample is not self._checked_sample:
+                self._checked_sample = sample
+                self.check_thresholds(sample.cpu, sample.ram, sample.gpu)
+                self._adapt_poll_interval()
+
+            # Minimizada u oculta no se pinta nada; al volver a mostrarse se
+            # pinta la última muestra en el siguiente tick
+            if sample is not self._shown_sample and self.state() not in ('iconic', 'withdrawn'):
+                self._shown_sample = sample
+                self.update_ui(sample.cpu, sample.ram, sample.gpu, sample.vmem, sample.gpu_info)
+
+        self.after(UI_REFRESH_MS, self._ui_tick)
+
     def create_menu(self) -> None:
         """Crea la barra de menú"""
         toolbar = UIFactory.create_frame(
@@ -899,7 +1230,7 @@ class MonitorApp(ctk.CTk):
             self.gpu_card.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
 
             # Configurar gráfico
-            if self.settings.settings['graph']['show']:
+            if self.settings.show_graph:
                 self.setup_graph()
 
         self.current_view = "monitor"
@@ -934,7 +1265,7 @@ class MonitorApp(ctk.CTk):
                 title = ctk.CTkLabel(
                     main_settings,
                     text="System Monitor Settings",
-                    font=('Segoe UI', 24, 'bold'),
+                    font=get_font(24, bold=True),
                     text_color=self.colors['text']
                 )
                 title.pack(pady=(20,30))
@@ -970,7 +1301,7 @@ class MonitorApp(ctk.CTk):
             self.settings_btn.configure(fg_color=self.colors['primary'])
 
         except Exception as e:
-            self.logger.error(f"Error al mostrar configuración: {str(e)}")
+            self.logger.error("Error al mostrar configuración: %s", e)
             messagebox.showerror("Error", "No se pudo abrir la configuración. Por favor, intente nuevamente.")
 
     def create_threshold_panel(self, parent):
@@ -980,7 +1311,7 @@ class MonitorApp(ctk.CTk):
         title = ctk.CTkLabel(
             frame,
             text="Alert Thresholds",
-            font=('Segoe UI', 20, 'bold'),
+            font=get_font(20, bold=True),
             text_color=self.colors['text']
         )
         title.pack(pady=(0,20))
@@ -993,7 +1324,7 @@ class MonitorApp(ctk.CTk):
         desc = ctk.CTkLabel(
             main_container,
             text="Set the threshold values for resource usage alerts",
-            font=('Segoe UI', 12),
+            font=get_font(12),
             text_color='gray'
         )
         desc.pack(pady=(15,20), padx=15)
@@ -1015,7 +1346,7 @@ class MonitorApp(ctk.CTk):
             resource_title = ctk.CTkLabel(
                 control_frame,
                 text=f"{display_name} Threshold",
-                font=('Segoe UI', 14, 'bold'),
+                font=get_font(14, bold=True),
                 text_color=self.colors['text']
             )
             resource_title.pack(anchor='w', pady=(0,5))
@@ -1025,7 +1356,8 @@ class MonitorApp(ctk.CTk):
                 control_frame,
                 "",  # Título vacío porque ya lo pusimos arriba
                 self.settings.settings['thresholds'].get(resource, 80),
-                colors=self.colors
+                colors=self.colors,
+                on_change=partial(self.update_threshold, resource)
             )
             control.pack(fill='x')
             self.threshold_controls[resource] = control
@@ -1038,14 +1370,24 @@ class MonitorApp(ctk.CTk):
         return frame
 
     def setup_graph(self):
+        # matplotlib se importa aquí para no cargarlo al arrancar si el gráfico
+        # está desactivado en la configuración
+        import matplotlib.dates as mdates
+        import matplotlib.style as mplstyle
+        from matplotlib.artist import setp
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Configurar estilo de matplotlib según el tema
         if self.settings.settings['theme'] == 'dark':
-            plt.style.use('dark_background')
+            mplstyle.use('dark_background')
         else:
-            plt.style.use('default')
+            mplstyle.use('default')
 
-        # Crear figura y ejes con un tamaño inicial ms pequeño y márgenes ajustados
-        self.fig = plt.figure(figsize=(8, 3), facecolor=self.colors['card_bg'])
+        # Crear figura y ejes con un tamaño inicial ms pequeño y márgenes ajustados.
+        # Figure directa en lugar de pyplot: no queda registrada en el gestor de
+        # figuras global, así que recrear el gráfico no acumula figuras vivas
+        self.fig = Figure(figsize=(8, 3), dpi=100, facecolor=self.colors['card_bg'])
         self.ax = self.fig.add_subplot(111)
         self.fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.2)
 
@@ -1053,6 +1395,7 @@ class MonitorApp(ctk.CTk):
 
         # Configurar estilo del gráfico
         self.ax.grid(True, color=self.colors['text'], alpha=self.settings.settings['graph']['grid_alpha'], linestyle='--')
+        # Límites fijos del eje Y: las muestras se limitan a 0-100 al muestrear
         self.ax.set_ylim(0, 100)
 
         # Configurar colores y etiquetas con líneas más visibles
@@ -1063,7 +1406,8 @@ class MonitorApp(ctk.CTk):
             marker='.',
             markersize=4,
             linestyle='-',
-            solid_capstyle='round'
+            solid_capstyle='round',
+            animated=True
         )
         self.ram_line, = self.ax.plot([], [],
             label='RAM',
@@ -1072,7 +1416,8 @@ class MonitorApp(ctk.CTk):
             marker='.',
             markersize=4,
             linestyle='-',
-            solid_capstyle='round'
+            solid_capstyle='round',
+            animated=True
         )
         self.gpu_line, = self.ax.plot([], [],
             label='GPU',
@@ -1081,19 +1426,12 @@ class MonitorApp(ctk.CTk):
             marker='.',
             markersize=4,
             linestyle='-',
-            solid_capstyle='round'
+            solid_capstyle='round',
+            animated=True
         )
 
         # Configurar leyenda con mejor visibilidad
-        self.ax.legend(
-            facecolor=self.colors['card_bg'],
-            edgecolor=self.colors['text'],
-            labelcolor=self.colors['text'],
-            loc='upper left',
-            bbox_to_anchor=(0.02, 0.98),
-            framealpha=0.8,
-            shadow=True
-        )
+        self._make_legend()
 
         # Configurar etiquetas de ejes con mejor visibilidad
         self.ax.tick_params(colors=self.colors['text'], length=6, width=1, direction='out')
@@ -1108,7 +1446,7 @@ class MonitorApp(ctk.CTk):
         self.ax.xaxis.set_major_formatter(formatter)
 
         # Rotar etiquetas para mejor legibilidad
-        plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
 
         # Crear frame para el gráfico
         if hasattr(self, 'graph_frame'):
@@ -1119,28 +1457,83 @@ class MonitorApp(ctk.CTk):
 
         # Crear canvas con mejor resolución
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
-        self.fig.set_dpi(100)  # Aumentar DPI para mejor calidad
+
+        # Fondo cacheado (ejes, rejilla, leyenda) para blitting de las líneas;
+        # se recaptura en cada dibujado completo, incluidos los que matplotlib
+        # hace por su cuenta al redimensionar el widget
+        self._graph_bg = None
+        self._graph_xlim = None
+        self._graph_x_pad = 0.0
+        self._last_draw = 0.0
+        self._graph_needs_full_draw = True
+        self._draw_pending = False
+        self.canvas.mpl_connect('draw_event', self._on_graph_draw)
+
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
 
         # Configurar el manejo de eventos de redimensionamiento
         self._resize_timer = None
 
+    def _make_legend(self):
+        """Crea (o reemplaza) la leyenda con los colores actuales de las líneas"""
+        self.ax.legend(
+            facecolor=self.colors['card_bg'],
+            edgecolor=self.colors['text'],
+            labelcolor=self.colors['text'],
+            loc='upper left',
+            bbox_to_anchor=(0.02, 0.98),
+            framealpha=0.8,
+            shadow=True
+        )
+
+    def _restyle_graph(self):
+        """Aplica colores y estilo de la configuración a la figura existente"""
+        colors = self.colors
+        graph_settings = self.settings.settings['graph']
+
+        self.graph_frame.configure(fg_color=colors['card_bg'])
+        self.fig.set_facecolor(colors['card_bg'])
+        self.ax.set_facecolor(colors['card_bg'])
+        self.ax.grid(True, color=colors['text'], alpha=graph_settings['grid_alpha'], linestyle='--')
+
+        for line, metric in (
+            (self.cpu_line, 'cpu'),
+            (self.ram_line, 'ram'),
+            (self.gpu_line, 'gpu')
+        ):
+            line.set_color(colors['metrics'][metric])
+            line.set_linewidth(graph_settings['line_width'])
+        self._make_legend()
+
+        self.ax.tick_params(colors=colors['text'])
+        for spine in self.ax.spines.values():
+            spine.set_color(colors['text'])
+
+        self._request_draw(full_redraw=True)
+
     def update_graph(self):
         """Actualización optimizada del gráfico con manejo de errores"""
         try:
-            if not hasattr(self, 'canvas') or not self.settings.settings['graph']['show']:
+            if not hasattr(self, 'canvas') or not self.settings.show_graph:
+                return
+
+            # Si el redibujado está limitado, no preparar nada que no se va a pintar
+            now = time.monotonic()
+            if now - self._last_draw <= GRAPH_MIN_DRAW_INTERVAL:
                 return
 
-            timestamps = self.cpu_metrics.get_timestamps()
-            if len(timestamps) < 2:
+            raw_timestamps = self.cpu_metrics.get_timestamps()
+            if len(raw_timestamps) < 2:
                 return
 
-            # Convertir timestamps a datetime de manera segura
+            # Convertir timestamps a datetime64 en un solo paso vectorizado; se
+            # desplazan a hora local igual que datetime.fromtimestamp
             try:
-                timestamps = [datetime.fromtimestamp(ts) for ts in timestamps]
+                utc_offset = time.localtime(raw_timestamps[-1]).tm_gmtoff
+                timestamps = ((raw_timestamps + utc_offset) * 1e6).astype('datetime64[us]')
             except (ValueError, TypeError) as e:
-                self.logger.error(f"Error al convertir timestamps: {str(e)}")
+                self.logger.error("Error al convertir timestamps: %s", e)
                 return
 
             cpu_data = self.cpu_metrics.get_values()
@@ -1152,14 +1545,8 @@ class MonitorApp(ctk.CTk):
                 self.logger.error("Inconsistencia en la longitud de los datos")
                 return
 
-            # Asegurarse de que los datos no estén vacíos y sean válidos
-            if not any(len(data) > 0 for data in [cpu_data, ram_data, gpu_data]):
-                return
-
-            # Validar que los datos estén en el rango correcto
-            cpu_data = np.clip(cpu_data, 0, 100)
-            ram_data = np.clip(ram_data, 0, 100)
-            gpu_data = np.clip(gpu_data, 0, 100)
+            # Los valores ya se limitan a 0-100 al muestrear (_get_system_metrics),
+            # así que los arrays del buffer circular se pasan sin copiar
 
             # Actualizar datos de manera segura
             try:
@@ -1167,30 +1554,67 @@ class MonitorApp(ctk.CTk):
                 self.ram_line.set_data(timestamps, ram_data)
                 self.gpu_line.set_data(timestamps, gpu_data)
 
-                # Ajustar límites del eje X con margen
-                if timestamps:
-                    x_min, x_max = timestamps[0], timestamps[-1]
-                    margin = timedelta(seconds=5)
-                    self.ax.set_xlim(x_min - margin, x_max + margin)
+                # Eje X estable: solo se reencuadra (redibujando el fondo) cuando
+                # los datos salen de la ventana o sobra demasiado a la izquierda;
+                # el resto de muestras se pintan con blit sobre el fondo cacheado
+                first, last = raw_timestamps[0], raw_timestamps[-1]
+                xlim = self._graph_xlim
+                if (xlim is None or last > xlim[1]
+                        or first - xlim[0] > GRAPH_X_MARGIN + self._graph_x_pad):
+                    pad = max(GRAPH_X_MARGIN, (last - first) * GRAPH_X_HEADROOM)
+                    xlim = (first - GRAPH_X_MARGIN, last + pad)
+                    self.ax.set_xlim(datetime.fromtimestamp(xlim[0]), datetime.fromtimestamp(xlim[1]))
+                    self._graph_xlim = xlim
+                    self._graph_x_pad = pad
+                    self._graph_needs_full_draw = True
+
+                self._request_draw()
+                self._last_draw = now
 
-                # Ajustar límites del eje Y si es necesario
-                y_max = max(max(cpu_data), max(ram_data), max(gpu_data))
-                if y_max > 100:
-                    self.ax.set_ylim(0, min(y_max * 1.1, 100))
-                else:
-                    self.ax.set_ylim(0, 100)
+            except Exception as e:
+                self.logger.error("Error al actualizar datos del gráfico: %s", e)
 
-                # Actualizar vista solo si es necesario
-                if not hasattr(self, '_last_draw') or time.time() - self._last_draw > 0.5:
-                    self.canvas.draw_idle()
-                    self._last_draw = time.time()
-                    self.logger.debug("Gráfico actualizado correctamente")
+        except Exception as e:
+            self.logger.error("Error en update_graph: %s", e, exc_info=True)
 
-            except Exception as e:
-                self.logger.error(f"Error al actualizar datos del gráfico: {str(e)}")
+    def _request_draw(self, full_redraw: bool = False) -> None:
+        """Programa un único redibujado en el próximo idle, agrupando peticiones"""
+        if full_redraw:
+            self._graph_needs_full_draw = True
+        if self._draw_pending:
+            return
+        self._draw_pending = True
+        self.after_idle(self._maybe_draw)
 
+    def _maybe_draw(self) -> None:
+        """Ejecuta el redibujado pendiente"""
+        if not self._draw_pending:
+            return
+        self._draw_pending = False
+        try:
+            self._blit_graph(full_redraw=self._graph_needs_full_draw)
+            self.logger.debug("Gráfico actualizado correctamente")
         except Exception as e:
-            self.logger.error(f"Error en update_graph: {str(e)}", exc_info=True)
+            self.logger.error("Error al redibujar el gráfico: %s", e, exc_info=True)
+
+    def _blit_graph(self, full_redraw: bool = False) -> None:
+        """Redibuja solo las líneas sobre el fondo cacheado (blitting)"""
+        if full_redraw or self._graph_bg is None:
+            # Redibujar ejes/rejilla/leyenda; _on_graph_draw cachea el fondo
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self._graph_bg)
+        for line in (self.cpu_line, self.ram_line, self.gpu_line):
+            self.ax.draw_artist(line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _on_graph_draw(self, event: Any) -> None:
+        """Cachea el fondo recién dibujado y pinta encima las líneas animadas"""
+        self._graph_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._graph_needs_full_draw = False
+        for line in (self.cpu_line, self.ram_line, self.gpu_line):
+            self.ax.draw_artist(line)
 
     def on_resize(self, event):
         # Solo procesar eventos de la ventana principal
@@ -1213,18 +1637,28 @@ class MonitorApp(ctk.CTk):
                 # Actualizar el tamaño de la figura
                 self.fig.set_size_inches(width, height)
 
-                # Redibujar el canvas
-                self.canvas.draw_idle()
+                # Redibujar el canvas y recapturar el fondo con el nuevo tamaño
+                self._request_draw(full_redraw=True)
         except Exception as e:
-            self.logger.error(f"Error en _delayed_resize: {str(e)}", exc_info=True)
+            self.logger.error("Error en _delayed_resize: %s", e, exc_info=True)
         finally:
             self._resize_timer = None
 
     def on_closing(self):
         """Limpieza y cierre optimizado"""
         self.logger.info("Cerrando aplicación")
-        self.running = False
+        self._stop_event.set()
+        self._enqueue_notification(None)
+        self._sampler.shutdown(wait=False, cancel_futures=True)
+        self._close_cpu_freq_fds()
+        if self._nvml_handle is not None:
+            self._nvml_handle = None
+            try:
+                pynvml.nvmlShutdown()
+            except Exception as e:
+                self.logger.warning("Error al cerrar NVML: %s", e)
         self.performance_monitor.stop_profiling()
+        shutdown_logging()
         self.quit()
 
     def apply_settings(self):
@@ -1234,28 +1668,38 @@ class MonitorApp(ctk.CTk):
             self.colors = THEME
             self.configure(fg_color=self.colors['background'])
 
+            # El siguiente _schedule_sample ya usa el nuevo intervalo
+            self.update_interval = self.settings.update_interval
+            self._poll_interval = self.update_interval
+            self._show_notifications = self.settings.show_notifications
+
             # Actualizar modo de apariencia
             try:
                 ctk.set_appearance_mode("dark" if self.settings.settings.get('theme') == 'dark' else "light")
             except Exception as e:
-                self.logger.error(f"Error al cambiar el tema: {str(e)}")
+                self.logger.error("Error al cambiar el tema: %s", e)
 
             # Actualizar widgets si existen
             if hasattr(self, '_update_widget_colors'):
                 self._update_widget_colors()
 
-            # Actualizar gráfico si es necesario
-            if hasattr(self, 'graph_frame'):
-                try:
-                    if self.settings.settings.get('graph', {}).get('show', True):
+            # Actualizar gráfico: la figura y el canvas se construyen una sola
+            # vez; después solo se ocultan/muestran y se reestilizan
+            try:
+                if self.settings.show_graph:
+                    if hasattr(self, 'canvas'):
+                        if not self.graph_frame.winfo_manager():
+                            self.graph_frame.pack(fill='both', expand=True, padx=10, pady=10)
+                        self._restyle_graph()
+                    elif self.monitor_view is not None:
                         self.setup_graph()
-                    else:
-                        self.graph_frame.grid_remove()
-                except Exception as e:
-                    self.logger.error(f"Error al actualizar el gráfico: {str(e)}")
+                elif hasattr(self, 'graph_frame'):
+                    self.graph_frame.pack_forget()
+            except Exception as e:
+                self.logger.error("Error al actualizar el gráfico: %s", e)
 
         except Exception as e:
-            self.logger.error(f"Error al aplicar configuración: {str(e)}", exc_info=True)
+            self.logger.error("Error al aplicar configuración: %s", e, exc_info=True)
             messagebox.showerror("Error", "No se pudo aplicar la configuración. Se utilizará la configuración por defecto.")
 
     def _update_widget_colors(self):
@@ -1273,184 +1717,185 @@ class MonitorApp(ctk.CTk):
             card.title_label.configure(text_color=self.colors['text'])
             card.value_label.configure(text_color=self.colors['text'])
 
+    def _init_nvml(self) -> Any:
+        """Inicializa NVML y devuelve el handle de la primera GPU, o None"""
+        if not NVML_AVAILABLE:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except Exception as e:
+            self.logger.warning("No se pudo inicializar NVML: %s", e)
+            return None
+        try:
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except Exception as e:
+            self.logger.warning("NVML no encontró ninguna GPU: %s", e)
+            pynvml.nvmlShutdown()
+            return None
+
+    def _detect_gpu(self) -> bool:
+        """Comprueba al arrancar si GPUtil encuentra alguna GPU"""
+        if not GPU_AVAILABLE:
+            return False
+        try:
+            gpus = GPUtil.getGPUs()
+            if not gpus:
+                return False
+            self._gpu_has_temp = hasattr(gpus[0], 'temperature')
+            return True
+        except Exception as e:
+            self.logger.warning("No se pudo detectar la GPU: %s", e)
+            return False
+
     def get_gpu_usage(self):
         """Obtiene el uso de GPU de manera segura"""
-        if not GPU_AVAILABLE:
+        if not self.gpu_present:
             return 0, None
 
         try:
-            gpus = GPUtil.getGPUs()
-            if gpus and len(gpus) > 0:
+            handle = self._nvml_handle
+            if handle is not None:
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+                return util.gpu, temp
+            gpus = self._read_gpus()
+            if gpus:
                 gpu = gpus[0]
-                return gpu.load * 100 if gpu.load is not None else 0, getattr(gpu, 'temperature', None)
+                temp = gpu.temperature if self._gpu_has_temp else None
+                return gpu.load * 100 if gpu.load is not None else 0, temp
         except Exception as e:
-            self.logger.error(f"Error al obtener información de GPU: {str(e)}", exc_info=True)
+            self._log_failure('gpu_usage', "Error al obtener información de GPU: %s", e)
         return 0, None
 
     def get_disk_usage(self):
         try:
-            if platform.system() == 'Windows':
-                disk = psutil.disk_usage('C:\\')  # Usar la unidad C: en Windows
-            else:
-                disk = psutil.disk_usage('/')  # Usar root en sistemas Unix
-            return disk.percent
+            return psutil.disk_usage(DISK_ROOT).percent
         except Exception as e:
-            self.logger.error(f"Error al obtener uso de disco: {str(e)}", exc_info=True)
+            self.logger.error("Error al obtener uso de disco: %s", e, exc_info=True)
             return 0
 
-    def check_thresholds(self, cpu, ram, gpu):
-        try:
-            if cpu > self.thresholds['cpu'] and self.should_notify('cpu'):
-                self.show_notification("CPU Alert", f"CPU uso alto: {cpu:.1f}%")
-            if ram > self.thresholds['ram'] and self.should_notify('ram'):
-                self.show_notification("RAM Alert", f"RAM uso alto: {ram:.1f}%")
-            if gpu > self.thresholds['gpu'] and self.should_notify('gpu'):
-                self.show_notification("GPU Alert", f"GPU uso alto: {gpu:.1f}%")
-        except Exception as e:
-            self.logger.error(f"Error al verificar umbrales: {str(e)}", exc_info=True)
-
-    def show_notification(self, title, message):
-        try:
-            notification.notify(
-                title=title,
-                message=message,
-                app_icon=None,
-                timeout=10,
-            )
-            self.logger.info(f"Notificación enviada: {title} - {message}")
-        except Exception as e:
-            self.logger.error(f"Error al mostrar notificación: {str(e)}", exc_info=True)
-
     def update_threshold(self, resource, value):
         try:
             self.thresholds[resource] = value
-            self.logger.info(f"Umbral actualizado - {resource}: {value}")
+            self._refresh_threshold_array()
+            # Registrar solo el valor final tras THRESHOLD_LOG_DELAY_MS sin cambios
+            pending = self._threshold_log_jobs.pop(resource, None)
+            if pending is not None:
+                self.after_cancel(pending)
+            self._threshold_log_jobs[resource] = self.after(
+                THRESHOLD_LOG_DELAY_MS, self._log_threshold, resource
+            )
         except Exception as e:
-            self.logger.error(f"Error al actualizar umbral: {str(e)}", exc_info=True)
+            self.logger.error("Error al actualizar umbral: %s", e, exc_info=True)
 
-    def should_notify(self, resource):
-        """Control mejorado de notificaciones"""
-        now = datetime.now()
-        if resource not in self.notification_cooldown:
-            self.notification_cooldown[resource] = 0
+    def _refresh_threshold_array(self):
+        """Copia los umbrales de la configuración al vector de comparación"""
+        thresholds = self.thresholds
+        self._thresh_arr[:] = [
+            thresholds.get(resource, 80) for resource, _ in self._threshold_resources
+        ]
 
-        # Verificar el tiempo transcurrido desde la última notificación
-        if (now - self.last_notifications[resource]).total_seconds() > self.grace_period:
-            # Verificar el cooldown dinámico
-            current_time = time.time()
-            if current_time - self.notification_cooldown[resource] > self.grace_period:
-                self.last_notifications[resource] = now
-                self.notification_cooldown[resource] = current_time
-                return True
-        return False
+    def _log_threshold(self, resource):
+        """Registra el umbral una vez que el usuario deja de moverlo"""
+        self._threshold_log_jobs.pop(resource, None)
+        self.logger.info("Umbral actualizado - %s: %s", resource, self.thresholds[resource])
+
+    def _schedule_sample(self) -> None:
+        """Programa una muestra por intervalo desde el bucle de eventos de Tk"""
+        if self._stop_event.is_set():
+            return
+        # Si la muestra anterior sigue en curso (p. ej. nvidia-smi atascado) se
+        # omite esta en lugar de encolarla: nunca se acumulan lecturas atrasadas
+        future = self._sample_future
+        if future is None or future.done():
+            self._sample_future = self._sampler.submit(self.update_stats)
+        self.after(int(self._poll_interval * 1000), self._schedule_sample)
+
+    def _adapt_poll_interval(self) -> None:
+        """Espacia el muestreo en reposo y vuelve al intervalo base con carga"""
+        # _last_vals contiene la muestra que acaba de comprobar check_thresholds
+        if (self._last_vals * 2.0 >= self._thresh_arr).any():
+            self._poll_interval = self.update_interval
+        else:
+            limit = max(self.update_interval, IDLE_MAX_INTERVAL)
+            self._poll_interval = min(limit, self._poll_interval * 2)
 
     @performance_monitor
     def update_stats(self):
-        """Actualización optimizada de estadísticas"""
-        last_metrics_update = 0
-        metrics_update_interval = self.update_interval / 2
-        error_count = 0
+        """Toma, almacena y publica una muestra (se ejecuta en el hilo del sampler)"""
         max_errors = 3
-        min_update_interval = 0.1
         max_update_interval = 2.0
-        last_log_time = 0
-        log_interval = 60  # Loguear métricas cada 60 segundos
-
-        self.logger.info("Iniciando monitoreo de recursos")
-
-        log_debug("Iniciando bucle de monitoreo")
-        while self.running:
-            try:
-                current_time = time.time()
-                elapsed = current_time - self.last_update_time
-
-                # Logging periódico
-                if current_time - last_log_time >= log_interval:
-                    log_debug(f"Intervalo actual de actualización: {self.update_interval:.2f}s")
-                    metrics = self._get_system_metrics()
-                    if metrics:
-                        cpu_percent, ram_percent, gpu_percent = metrics
-                        log_metrics({
-                            'timestamp': datetime.now().isoformat(),
-                            'metrics': {
-                                'cpu': {
-                                    'percent': cpu_percent,
-                                    'frequency': self._get_cpu_frequency()
-                                },
-                                'ram': {
-                                    'percent': ram_percent,
-                                    'used_gb': psutil.virtual_memory().used / (1024**3),
-                                    'total_gb': psutil.virtual_memory().total / (1024**3)
-                                },
-                                'gpu': {
-                                    'percent': gpu_percent,
-                                    'info': self._get_gpu_info()
-                                }
-                            }
-                        })
-                        log_debug(f"Métricas actualizadas - CPU: {cpu_percent:.1f}%, RAM: {ram_percent:.1f}%, GPU: {gpu_percent:.1f}%")
-
-                        # Logging de rendimiento
-                        log_performance({
-                            'update_interval': self.update_interval,
-                            'elapsed_time': elapsed,
-                            'error_count': error_count,
-                            'metrics_count': len(self.cpu_metrics.get_values())
-                        })
-                    else:
-                        log_warning("No se pudieron obtener métricas del sistema")
-
-                    last_log_time = current_time
 
-                # Control de frecuencia de actualización
-                if elapsed < self.update_interval * 0.9:
-                    time.sleep(max(min_update_interval, self.update_interval - elapsed))
-                    continue
-
-                # Actualización de métricas
-                metrics = self._get_system_metrics()
-                if metrics:
-                    cpu_percent, ram_percent, gpu_percent = metrics
-                    timestamp = current_time
-
-                    # Almacenar métricas de manera segura
-                    try:
-                        with self._get_metrics_lock():
-                            self.cpu_metrics.add_metric(cpu_percent, timestamp)
-                            self.ram_metrics.add_metric(ram_percent, timestamp)
-                            self.gpu_metrics.add_metric(gpu_percent, timestamp)
-                            log_debug(f"Métricas almacenadas - CPU: {cpu_percent:.1f}%, RAM: {ram_percent:.1f}%, GPU: {gpu_percent:.1f}%")
+        try:
+            current_time = time.time()
+            elapsed = current_time - self.last_update_time
 
-                        # Actualizar UI y gráfico
-                        self.after(0, lambda: self.update_ui(cpu_percent, ram_percent, gpu_percent))
-                        self.after(0, self.update_graph)
+            # Actualización de métricas
+            snapshot = self._get_system_metrics(current_time)
+            # La lectura puede tardar: no publicar ni registrar nada tras el cierre
+            if snapshot is None or self._stop_event.is_set():
+                return
+            cpu_percent, ram_percent, gpu_percent = snapshot.cpu, snapshot.ram, snapshot.gpu
+            vmem = snapshot.vmem
+            add_cpu, add_ram, add_gpu = self._metric_writers
 
-                    except Exception as e:
-                        self.logger.error(f"Error al almacenar métricas: {str(e)}")
-                        error_count += 1
+            # Almacenar métricas de manera segura
+            try:
+                # Sin lock: este hilo es el único escritor y los buffers
+                # publican cada muestra con un solo store de su índice
+                add_cpu(cpu_percent, current_time)
+                add_ram(ram_percent, current_time)
+                add_gpu(gpu_percent, current_time)
+                log_debug("Métricas almacenadas - CPU: %.1f%%, RAM: %.1f%%, GPU: %.1f%%",
+                          cpu_percent, ram_percent, gpu_percent)
 
-                    self.last_update_time = current_time
+                # Publicar la muestra; _ui_tick la recoge desde el hilo principal
+                self._latest_sample = snapshot
 
             except Exception as e:
-                error_count += 1
-                self.logger.error(f"Error en update_stats: {str(e)}", exc_info=True)
-                if error_count >= max_errors:
-                    self.logger.error("Demasiados errores consecutivos, ajustando intervalo")
-                    self.update_interval = min(max_update_interval, self.update_interval * 1.5)
-                    error_count = 0
-                time.sleep(self.update_interval)
-
-    def _get_metrics_lock(self) -> Lock:
-        """Obtiene el lock para actualización de métricas"""
-        if not hasattr(self, '_metrics_lock'):
-            self._metrics_lock = Lock()
-        return self._metrics_lock
-
-    def _get_system_metrics(self) -> Optional[tuple[float, float, float]]:
-        """Obtiene las métricas del sistema de manera segura"""
+                self.logger.error("Error al almacenar métricas: %s", e)
+                self._error_count += 1
+
+            self.last_update_time = current_time
+
+            # Logging periódico con la muestra recién tomada
+            if current_time - self._last_log_time >= METRICS_LOG_INTERVAL:
+                # Un único registro plano con la muestra; el intervalo ya va en
+                # el registro de rendimiento
+                log_metrics({
+                    'timestamp': datetime.fromtimestamp(current_time).isoformat(),
+                    'cpu_percent': cpu_percent,
+                    'cpu_frequency': self._get_cpu_frequency(),
+                    'ram_percent': ram_percent,
+                    'ram_used_gb': vmem.used / (1024**3),
+                    'ram_total_gb': self._ram_total_gb,
+                    'gpu_percent': gpu_percent,
+                    'gpu_info': snapshot.gpu_info
+                })
+
+                # Logging de rendimiento
+                log_performance({
+                    'update_interval': self.update_interval,
+                    'elapsed_time': elapsed,
+                    'error_count': self._error_count,
+                    'metrics_count': len(self.cpu_metrics)
+                })
+
+                self._last_log_time = current_time
+
+        except Exception as e:
+            self._error_count += 1
+            self._log_failure('update_stats', "Error en update_stats: %s", e)
+            if self._error_count >= max_errors:
+                self.logger.error("Demasiados errores consecutivos, ajustando intervalo")
+                self.update_interval = min(max_update_interval, self.update_interval * 1.5)
+                self._error_count = 0
+
+    def _get_system_metrics(self, timestamp: float) -> Optional[SystemSnapshot]:
+        """Obtiene las métricas del sistema de manera segura en un SystemSnapshot"""
         try:
-            # Obtener CPU con timeout
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Obtener CPU desde la muestra anterior (cebada en __init__)
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Obtener RAM
             ram = psutil.virtual_memory()
@@ -1458,177 +1903,321 @@ class MonitorApp(ctk.CTk):
 
             # Obtener GPU de manera segura
             gpu_percent, _ = self.get_gpu_usage()
+            # Memoria y temperatura de la GPU se leen aquí, reutilizando la
+            # lectura de GPUtil recién hecha: la UI nunca lanza nvidia-smi
+            gpu_info = self._get_gpu_info()
 
-            # Validar valores
-            cpu_percent = max(0, min(100, float(cpu_percent)))
-            ram_percent = max(0, min(100, float(ram_percent)))
-            gpu_percent = max(0, min(100, float(gpu_percent)))
-
-            return cpu_percent, ram_percent, gpu_percent
+            # Validar valores; vmem viaja en la muestra para no volver a consultarlo
+            cpu_percent, ram_percent, gpu_percent = _clamp3(cpu_percent, ram_percent, gpu_percent)
+            return SystemSnapshot(timestamp, cpu_percent, ram_percent, gpu_percent, ram, gpu_info)
 
         except Exception as e:
-            self.logger.error(f"Error al obtener métricas del sistema: {str(e)}", exc_info=True)
+            self._log_failure('system_metrics', "Error al obtener métricas del sistema: %s", e)
             return None
 
+    def _log_failure(self, key: str, msg: str, *args) -> None:
+        """Registra un fallo con traza la primera vez y en debug las siguientes"""
+        if key in self._logged_once:
+            self.logger.debug(msg, *args)
+        else:
+            self._logged_once.add(key)
+            self.logger.error(msg, *args, exc_info=True)
+
     def _log_system_details(self):
         """Registra detalles adicionales del sistema"""
         try:
             # CPU
             cpu_freq = psutil.cpu_freq()
             if cpu_freq:
-                self.logger.debug(f"CPU Frecuencia - Current: {cpu_freq.current:.1f}MHz, "
-                                f"Min: {cpu_freq.min:.1f}MHz, Max: {cpu_freq.max:.1f}MHz")
+                self.logger.debug("CPU Frecuencia - Current: %.1fMHz, Min: %.1fMHz, Max: %.1fMHz",
+                                  cpu_freq.current, cpu_freq.min, cpu_freq.max)
 
             # Memoria
             mem = psutil.virtual_memory()
             self.logger.debug(
-                f"Memoria - Total: {mem.total/1024**3:.1f}GB, "
-                f"Disponible: {mem.available/1024**3:.1f}GB, "
-                f"Usado: {(mem.total - mem.available)/1024**3:.1f}GB"
+                "Memoria - Total: %.1fGB, Disponible: %.1fGB, Usado: %.1fGB",
+                mem.total / 1024**3,
+                mem.available / 1024**3,
+                (mem.total - mem.available) / 1024**3
             )
 
             # Disco
-            disk = psutil.disk_usage('/')
+            disk = psutil.disk_usage(DISK_ROOT)
             self.logger.debug(
-                f"Disco - Total: {disk.total/1024**3:.1f}GB, "
-                f"Usado: {disk.used/1024**3:.1f}GB, "
-                f"Libre: {disk.free/1024**3:.1f}GB"
+                "Disco - Total: %.1fGB, Usado: %.1fGB, Libre: %.1fGB",
+                disk.total / 1024**3,
+                disk.used / 1024**3,
+                disk.free / 1024**3
             )
 
-            # GPU si está disponible
-            if GPU_AVAILABLE:
+            # GPU si está disponible (detalle solo con GPUtil)
+            if self.gpu_present and GPU_AVAILABLE:
                 try:
                     gpus = GPUtil.getGPUs()
                     for i, gpu in enumerate(gpus):
                         self.logger.debug(
-                            f"GPU {i} - {gpu.name}: Memoria Total: {gpu.memoryTotal}MB, "
-                            f"Usada: {gpu.memoryUsed}MB, Temp: {getattr(gpu, 'temperature', 'N/A')}°C"
+                            "GPU %d - %s: Memoria Total: %sMB, Usada: %sMB, Temp: %s°C",
+                            i, gpu.name, gpu.memoryTotal, gpu.memoryUsed,
+                            getattr(gpu, 'temperature', 'N/A')
                         )
                 except Exception as e:
-                    self.logger.error(f"Error al obtener información detallada de GPU: {str(e)}")
+                    self.logger.error("Error al obtener información detallada de GPU: %s", e)
 
         except Exception as e:
-            self.logger.error(f"Error al registrar detalles del sistema: {str(e)}")
+            self.logger.error("Error al registrar detalles del sistema: %s", e)
 
     @performance_monitor
-    def update_ui(self, cpu_percent: float, ram_percent: float, gpu_percent: float) -> None:
+    def update_ui(self, cpu_percent: float, ram_percent: float, gpu_percent: float, vmem: Any,
+                  gpu_details: Optional[dict]) -> None:
         """Actualización optimizada de la interfaz de usuario"""
         try:
-            # Actualizar CPU
+            # Textos informativos a partir de plantillas precalculadas
+            gpu_shown = gpu_percent
             try:
-                freq = psutil.cpu_freq()
-                freq_info = f"Frecuencia: {freq.current:.0f}MHz" if freq else ""
-                self.cpu_card.update(cpu_percent, info_text=freq_info)
-                log_debug(f"UI CPU actualizada: {cpu_percent:.1f}% {freq_info}")
-            except Exception as e:
-                log_error(f"Error al actualizar UI CPU: {str(e)}")
-                self.cpu_card.update(cpu_percent)
-
-            # Actualizar RAM
-            try:
-                ram = psutil.virtual_memory()
-                total_gb = ram.total / (1024**3)
-                used_gb = (ram.total - ram.available) / (1024**3)
-                info_text = f"Usado: {used_gb:.1f}GB de {total_gb:.1f}GB"
-                self.ram_card.update(ram_percent, info_text=info_text)
-                log_debug(f"UI RAM actualizada: {ram_percent:.1f}% ({info_text})")
-            except Exception as e:
-                log_error(f"Error al actualizar UI RAM: {str(e)}")
-                self.ram_card.update(ram_percent)
-
-            # Actualizar GPU
-            try:
-                if GPU_AVAILABLE:
-                    gpu_info = self._get_gpu_info()
-                    if gpu_info:
-                        info_text = (f"Memoria: {gpu_info['memory_used']:.0f}MB/"
-                                   f"{gpu_info['memory_total']:.0f}MB")
-                        if gpu_info['temperature']:
-                            info_text += f" | Temp: {gpu_info['temperature']}°C"
-                        self.gpu_card.update(gpu_percent, info_text=info_text)
-                        log_debug(f"UI GPU actualizada: {gpu_percent:.1f}% ({info_text})")
-                    else:
-                        self.gpu_card.update(0, info_text="GPU no disponible")
-                        log_debug("GPU no disponible")
+                mhz = self._current_cpu_mhz()
+                cpu_info = CPU_FREQ_TEMPLATE % mhz if mhz else ""
+                ram_info = self._ram_template % ((vmem.total - vmem.available) / (1024**3))
+                if not GPU_AVAILABLE and self._nvml_handle is None:
+                    gpu_shown, gpu_info = 0, "GPUtil no instalado"
                 else:
-                    self.gpu_card.update(0, info_text="GPUtil no instalado")
-                    log_debug("GPUtil no instalado")
+                    if gpu_details:
+                        gpu_info = GPU_MEMORY_TEMPLATE % (gpu_details['memory_used'], gpu_details['memory_total'])
+                        if gpu_details['temperature']:
+                            gpu_info += GPU_TEMP_TEMPLATE % gpu_details['temperature']
+                    else:
+                        gpu_shown, gpu_info = 0, "GPU no disponible"
             except Exception as e:
-                log_error(f"Error al actualizar UI GPU: {str(e)}")
-                self.gpu_card.update(0, info_text="Error al leer GPU")
-
-            # Actualizar gráfico si está visible y hay cambios significativos
-            if (self.settings.settings['graph']['show'] and
-                hasattr(self, 'graph_frame') and
-                any(abs(x - y) > 0.5 for x, y in [
-                    (cpu_percent, self.cpu_metrics.get_values()[-1] if self.cpu_metrics.get_values().size > 0 else 0),
-                    (ram_percent, self.ram_metrics.get_values()[-1] if self.ram_metrics.get_values().size > 0 else 0),
-                    (gpu_percent, self.gpu_metrics.get_values()[-1] if self.gpu_metrics.get_values().size > 0 else 0)
-                ])):
+                # Mostrar igualmente los porcentajes, conservando los textos previos
+                log_error("Error al preparar la información de la UI: %s", e)
+                cpu_info = ram_info = gpu_info = None
+
+            for card, percent, info_text in (
+                (self.cpu_card, cpu_percent, cpu_info),
+                (self.ram_card, ram_percent, ram_info),
+                (self.gpu_card, gpu_shown, gpu_info)
+            ):
+                card.update(percent, info_text=info_text)
+            log_debug("UI actualizada - CPU: %.1f%% (%s), RAM: %.1f%% (%s), GPU: %.1f%% (%s)",
+                      cpu_percent, cpu_info, ram_percent, ram_info, gpu_shown, gpu_info)
+
+            # Actualizar gráfico en la misma pasada (una vez por muestra nueva)
+            if self.settings.show_graph:
                 self.update_graph()
 
-            # Verificar umbrales
-            self.check_thresholds(cpu_percent, ram_percent, gpu_percent)
-
         except Exception as e:
             log_error("Error general en actualización de UI", exc_info=True)
 
     def check_thresholds(self, cpu: float, ram: float, gpu: float) -> None:
         """Verificación optimizada de umbrales"""
-        try:
-            current_time = time.time()
-            for resource, value in [('cpu', cpu), ('ram', ram), ('gpu', gpu)]:
-                if (value > self.thresholds[resource] and
-                    current_time - self.notification_cooldown.get(resource, 0) > self.grace_period):
-                    message = f"{resource.upper()} uso alto: {value:.1f}%"
-                    self.show_notification(f"{resource.upper()} Alert", message)
-                    log_warning(f"Umbral excedido - {message}")
-                    self.notification_cooldown[resource] = current_time
-        except Exception as e:
-            log_error(f"Error al verificar umbrales: {str(e)}", exc_info=True)
+        # Solo aritmética sobre vectores preasignados: nada que pueda fallar
+        # salvo el envío del aviso, que es lo único protegido con try
+        last_vals = self._last_vals
+        last_vals[:] = (cpu, ram, gpu)
+        over = last_vals > self._thresh_arr
+        if not over.any():
+            return
+        # Descartar en la misma pasada los recursos en periodo de gracia
+        now = time.monotonic_ns()
+        cooldown = self.notification_cooldown
+        over &= (now - cooldown) > self._grace_period_ns
+        if not over.any():
+            return
+
+        # Alertar solo si el uso es alto ahora y sostenido en la ventana;
+        # la media se calcula únicamente para los recursos que quedan
+        names = []
+        alerts = []
+        for i in np.flatnonzero(over):
+            mean = self._threshold_resources[i][1].recent_mean(THRESHOLD_WINDOW)
+            if mean > self._thresh_arr[i]:
+                cooldown[i] = now
+                name, template = self._alert_templates[i]
+                names.append(name)
+                alerts.append(template % mean)
+
+        # Los recursos que se disparan en la misma muestra se agrupan en
+        # una sola notificación y un solo registro
+        if alerts:
+            message = ", ".join(alerts)
+            try:
+                self.show_notification("+".join(names) + " Alert", message)
+                log_warning("Umbral excedido - %s", message)
+            except Exception as e:
+                log_error("Error al notificar umbral excedido: %s", e, exc_info=True)
 
     def show_notification(self, title: str, message: str) -> None:
-        """Muestra notificaciones de manera segura"""
-        try:
-            if self.settings.settings['show_notifications']:
-                notification.notify(
+        """Encola una notificación para el hilo notificador"""
+        if not self._show_notifications:
+            return
+        self._enqueue_notification((title, message))
+
+    def _enqueue_notification(self, item) -> None:
+        """Encola sin bloquear, descartando la notificación más antigua si no cabe"""
+        while True:
+            try:
+                self._notif_q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._notif_q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _notif_worker(self) -> None:
+        """Envía las notificaciones encoladas hasta recibir None"""
+        while True:
+            item = self._notif_q.get()
+            if item is None:
+                return
+            title, message = item
+            try:
+                notify = self._notify
+                if notify is None:
+                    # plyer solo se carga con la primera notificación; el método
+                    # del backend se guarda para no pasar por su proxy cada vez
+                    from plyer import notification
+                    notify = self._notify = notification.notify
+                notify(
                     title=title,
                     message=message,
                     app_icon=None,
                     timeout=10,
                 )
-                log_debug(f"Notificación enviada: {title} - {message}")
-        except Exception as e:
-            log_error(f"Error al mostrar notificación: {str(e)}", exc_info=True)
+                log_debug("Notificación enviada: %s - %s", title, message)
+            except Exception as e:
+                log_error("Error al mostrar notificación: %s", e, exc_info=True)
+
+    def _open_cpu_freq_fds(self) -> tuple:
+        """Abre scaling_cur_freq de cada CPU para leerlo luego con os.pread"""
+        if not hasattr(os, 'pread') or not os.path.isdir(SYSFS_CPU_DIR):
+            return ()
+        fds = []
+        try:
+            for name in os.listdir(SYSFS_CPU_DIR):
+                if not (name.startswith('cpu') and name[3:].isdigit()):
+                    continue
+                path = os.path.join(SYSFS_CPU_DIR, name, 'cpufreq', 'scaling_cur_freq')
+                try:
+                    fds.append(os.open(path, os.O_RDONLY))
+                except OSError:
+                    pass
+        except OSError as e:
+            self.logger.warning("No se pudo abrir la frecuencia de CPU en sysfs: %s", e)
+        return tuple(fds)
+
+    def _close_cpu_freq_fds(self) -> None:
+        """Cierra los descriptores de sysfs; solo un llamador recibe la tupla a cerrar"""
+        with self._cpu_freq_lock:
+            fds, self._cpu_freq_fds = self._cpu_freq_fds, ()
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _current_cpu_mhz(self) -> Optional[float]:
+        """Frecuencia media actual en MHz: pread sobre sysfs o, si no, psutil"""
+        error = None
+        with self._cpu_freq_lock:
+            fds = self._cpu_freq_fds
+            if fds:
+                try:
+                    # sysfs da kHz; misma media entre CPUs que psutil.cpu_freq()
+                    return sum(int(os.pread(fd, 32, 0)) for fd in fds) / (len(fds) * 1000.0)
+                except (OSError, ValueError) as e:
+                    error = e
+        if error is not None:
+            self._log_failure('cpu_freq_sysfs', "Error al leer la frecuencia de CPU en sysfs: %s", error)
+            self._close_cpu_freq_fds()
+        freq = self._cached_cpu_freq()
+        return freq.current if freq else None
+
+    def _cached_cpu_freq(self):
+        """Devuelve psutil.cpu_freq(), consultándolo como mucho una vez cada CPU_FREQ_TTL"""
+        read_time, freq = self._cpu_freq_cache
+        now = time.monotonic()
+        if now - read_time < CPU_FREQ_TTL:
+            return freq
+        freq = psutil.cpu_freq()
+        self._cpu_freq_cache = (now, freq)
+        return freq
 
     def _get_cpu_frequency(self):
         try:
-            freq = psutil.cpu_freq()
-            if freq:
-                return {
-                    'current': freq.current,
-                    'min': freq.min,
-                    'max': freq.max
-                }
+            # min/max no cambian tras el arranque: se leen una sola vez y
+            # después solo se consulta la frecuencia actual
+            static = self._cpu_freq_static
+            if static is None:
+                freq = self._cached_cpu_freq()
+                if not freq:
+                    return None
+                static = self._cpu_freq_static = {'min': freq.min, 'max': freq.max}
+            current = self._current_cpu_mhz()
+            if current is not None:
+                return {'current': current, **static}
         except Exception as e:
-            log_error(f"Error al obtener frecuencia de CPU: {str(e)}")
+            self._log_failure('cpu_freq', "Error al obtener frecuencia de CPU: %s", e)
         return None
 
+    def _read_gpus(self):
+        """Devuelve GPUtil.getGPUs(), reutilizando la lectura del intervalo actual"""
+        read_time, gpus = self._gpu_cache
+        now = time.monotonic()
+        # El intervalo real es _poll_interval, que se alarga en reposo
+        if now - read_time < self._poll_interval * 0.9:
+            return gpus
+        gpus = GPUtil.getGPUs()
+        self._gpu_cache = (now, gpus)
+        return gpus
+
     def _get_gpu_info(self):
+        """Obtiene memoria y temperatura de la GPU, refrescadas cada SLOW_METRICS_INTERVAL.
+
+        Solo lo llama el sampler (_get_system_metrics); la UI recibe el
+        resultado en SystemSnapshot.gpu_info.
+        """
+        now = time.monotonic()
+        if now - self._gpu_info_time < SLOW_METRICS_INTERVAL:
+            return self._gpu_info
+
+        gpu_info = None
         try:
-            if GPU_AVAILABLE:
-                gpus = GPUtil.getGPUs()
+            # Nombre y memoria total no cambian en la sesión: se leen una vez
+            # y cada lectura solo consulta la memoria usada y la temperatura
+            handle = self._nvml_handle
+            if handle is not None:
+                # NVML da la memoria en bytes; GPUtil la da en MB
+                memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                if self._gpu_static is None:
+                    self._gpu_static = {
+                        'name': pynvml.nvmlDeviceGetName(handle),
+                        'memory_total': memory.total / (1024**2)
+                    }
+                gpu_info = {
+                    **self._gpu_static,
+                    'memory_used': memory.used / (1024**2),
+                    'temperature': pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+                }
+            elif self.gpu_present:
+                gpus = self._read_gpus()
                 if gpus:
                     gpu = gpus[0]
-                    return {
-                        'name': gpu.name,
+                    if self._gpu_static is None:
+                        self._gpu_static = {
+                            'name': gpu.name,
+                            'memory_total': gpu.memoryTotal
+                        }
+                    gpu_info = {
+                        **self._gpu_static,
                         'memory_used': gpu.memoryUsed,
-                        'memory_total': gpu.memoryTotal,
-                        'temperature': getattr(gpu, 'temperature', None)
+                        'temperature': gpu.temperature if self._gpu_has_temp else None
                     }
         except Exception as e:
-            log_error(f"Error al obtener información de GPU: {str(e)}")
-        return None
+            self._log_failure('gpu_info', "Error al obtener información de GPU: %s", e)
+
+        self._gpu_info = gpu_info
+        self._gpu_info_time = now
+        return gpu_info
 
 if __name__ == "__main__":
     app = MonitorApp()